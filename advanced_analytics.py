@@ -1,86 +1,127 @@
 #!/usr/bin/env python3
 """Advanced Analytics - Detailed insights and reports for Puthu Tracker"""
-import json
-import os
+import sys
 from datetime import datetime, timedelta
-from collections import defaultdict
+from importlib.util import find_spec
+from pathlib import Path
+from collections import namedtuple
+import numpy as np
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
+
+# Probe for reportlab once without paying for its import
+PDF_AVAILABLE = find_spec('reportlab') is not None
+
+ThemeColors = namedtuple('ThemeColors', ['tc', 'tm', 'bg', 'is_dark'])
+
+PRODUCTIVE_SCORE = 50  # Minimum daily score that keeps a streak going
+
+_DAY_NAMES = np.array(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
+
+
+def productivity_scores(app_counts, total_seconds):
+    """Score = 10 per app used + 5 per hour, capped at 100 (scalars or arrays)"""
+    # Simple scoring: more diverse usage = higher productivity
+    return np.minimum(100, app_counts * 10 + total_seconds / 720)
+
+
+def first_break(scores, threshold=PRODUCTIVE_SCORE):
+    """Index of the first score below threshold, or len(scores) if there is none"""
+    below = np.flatnonzero(scores < threshold)
+    return int(below[0]) if below.size else len(scores)
+
+
+def _intern_apps(rows):
+    """Intern app names in (app_name, duration) rows so widgets share one string per app"""
+    return [(sys.intern(app_name), duration) for app_name, duration in rows]
+
+
+def _fmt_hm(seconds):
+    """Format a duration as '1h 5m', or '5m' when under an hour"""
+    hours, rem = divmod(int(seconds), 3600)
+    minutes = rem // 60
+    return f"{hours}h {minutes}m" if hours else f"{minutes}m"
+
 
 class AnalyticsManager:
     """Manages analytics calculations and data processing"""
     
+    USAGE_CACHE_SIZE = 512
+    
     def __init__(self, db_manager):
         self.db = db_manager
+        self._usage_cache = {}  # {'YYYY-MM-DD': ((app, duration), ...)}
+    
+    def _usage_for_date(self, date):
+        """Get app usage for a date, memoized since past days never change"""
+        data = self._usage_cache.get(date)
+        if data is None:
+            if len(self._usage_cache) >= self.USAGE_CACHE_SIZE:
+                self._usage_cache.clear()
+            data = tuple(_intern_apps(self.db.get_app_usage_by_date(date)))
+            self._usage_cache[date] = data
+        return data
+    
+    def invalidate(self, date=None):
+        """Drop cached usage for a date (or everything) after new data is written"""
+        if date is None:
+            self._usage_cache.clear()
+        else:
+            self._usage_cache.pop(date, None)
     
     def get_top_apps(self, period='daily', date=None, limit=5):
         """Get top N apps for a period"""
         if date is None:
             date = datetime.now().strftime('%Y-%m-%d')
         
-        if period == 'daily':
-            data = self.db.get_app_usage_by_date(date)
-        elif period == 'weekly':
-            data = self.get_weekly_data()
-        elif period == 'monthly':
-            data = self.get_monthly_data()
-        else:
-            data = self.db.get_app_usage_by_date(date)
+        if period == 'weekly':
+            return self.get_weekly_data(limit)
+        if period == 'monthly':
+            return self.get_monthly_data(limit)
         
-        # Return top N apps
-        return data[:limit] if len(data) >= limit else data
+        # Daily usage is cached in full, so just slice off the top N
+        return list(self._usage_for_date(date)[:limit])
     
-    def get_weekly_data(self):
-        """Get aggregated data for the past 7 days"""
+    def get_weekly_data(self, limit=None):
+        """Get aggregated data for the past 7 days (today inclusive)"""
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=7)
-        
-        app_totals = defaultdict(int)
+        start_date = end_date - timedelta(days=6)
         
-        for i in range(8):
-            date = (start_date + timedelta(days=i)).strftime('%Y-%m-%d')
-            daily_data = self.db.get_app_usage_by_date(date)
-            for app, duration in daily_data:
-                app_totals[app] += duration
-        
-        # Convert to sorted list
-        return sorted(app_totals.items(), key=lambda x: x[1], reverse=True)
+        return self._aggregate_range(start_date, end_date, limit)
     
-    def get_monthly_data(self):
-        """Get aggregated data for the past 30 days"""
+    def get_monthly_data(self, limit=None):
+        """Get aggregated data for the past 30 days (today inclusive)"""
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
-        
-        app_totals = defaultdict(int)
+        start_date = end_date - timedelta(days=29)
         
-        for i in range(31):
-            date = (start_date + timedelta(days=i)).strftime('%Y-%m-%d')
-            daily_data = self.db.get_app_usage_by_date(date)
-            for app, duration in daily_data:
-                app_totals[app] += duration
-        
-        return sorted(app_totals.items(), key=lambda x: x[1], reverse=True)
+        return self._aggregate_range(start_date, end_date, limit)
+    
+    def _aggregate_range(self, start_date, end_date, limit=None):
+        """Sum app usage over an inclusive date range, sorted by total time"""
+        # SQLite does the per-app reduction, ordering and top-N cut
+        return _intern_apps(self.db.get_app_totals_range(
+            start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), limit
+        ))
     
     def get_heatmap_data(self, days=30):
         """Get daily usage data for heatmap"""
-        end_date = datetime.now()
+        end = np.datetime64(datetime.now().date(), 'D')
+        days_arr = np.arange(end - (days - 1), end + 1)
+        date_strs = days_arr.astype(str).tolist()
+        # datetime64[D] counts days from 1970-01-01, a Thursday
+        day_names = _DAY_NAMES[(days_arr.astype(np.int64) + 3) % 7].tolist()
+        daily_totals = dict(self.db.get_daily_totals_range(date_strs[0], date_strs[-1]))
         heatmap_data = []
         
-        for i in range(days):
-            date = (end_date - timedelta(days=days - i - 1)).strftime('%Y-%m-%d')
-            daily_data = self.db.get_app_usage_by_date(date)
-            total_seconds = sum(duration for _, duration in daily_data)
+        for date, day_name in zip(date_strs, day_names):
+            total_seconds = daily_totals.get(date, 0)
             total_hours = total_seconds / 3600
             
             heatmap_data.append({
                 'date': date,
                 'hours': total_hours,
-                'day_name': datetime.strptime(date, '%Y-%m-%d').strftime('%a')
+                'day_name': day_name
             })
         
         return heatmap_data
@@ -88,7 +129,7 @@ class AnalyticsManager:
     def calculate_productivity_score(self, date):
         """Calculate productivity score for a date (0-100)"""
         # This is a simple implementation - can be enhanced based on app categories
-        daily_data = self.db.get_app_usage_by_date(date)
+        daily_data = self._usage_for_date(date)
         
         if not daily_data:
             return 0
@@ -97,68 +138,100 @@ class AnalyticsManager:
         total_time = sum(duration for _, duration in daily_data)
         app_count = len(daily_data)
         
-        # Normalize score (this is simplified)
-        score = min(100, (app_count * 10) + (total_time / 3600) * 5)
-        return int(score)
+        return int(productivity_scores(app_count, total_time))
     
-    def get_productivity_streak(self):
-        """Calculate consecutive productive days"""
-        streak = 0
-        current_date = datetime.now()
+    def _score_array(self, days=365):
+        """Productivity scores for the last N days, index 0 = today"""
+        today = datetime.now().date()
+        start = today - timedelta(days=days - 1)
         
-        for i in range(365):  # Check up to a year
-            date = (current_date - timedelta(days=i)).strftime('%Y-%m-%d')
-            score = self.calculate_productivity_score(date)
-            
-            if score >= 50:  # Threshold for "productive day"
-                streak += 1
-            else:
-                break
+        usage = self.db.get_usage_range_np(start.isoformat(), today.isoformat())
+        offsets = (np.datetime64(today, 'D') - usage['date']).astype(np.int64)
         
-        return streak
+        # One row per (date, app), so per-day row counts are distinct app counts
+        app_counts = np.bincount(offsets, minlength=days)
+        total_seconds = np.bincount(offsets, weights=usage['dur'], minlength=days)
+        
+        return productivity_scores(app_counts, total_seconds)
+    
+    def get_productivity_streak(self, days=365):
+        """Calculate consecutive productive days"""
+        # Check up to a year in one query
+        return first_break(self._score_array(days))
     
     def compare_periods(self, period1_start, period1_end, period2_start, period2_end):
         """Compare two time periods"""
-        def get_period_stats(start, end):
-            days = (end - start).days + 1
-            total_time = 0
-            app_usage = defaultdict(int)
-            
-            for i in range(days):
-                date = (start + timedelta(days=i)).strftime('%Y-%m-%d')
-                daily_data = self.db.get_app_usage_by_date(date)
-                for app, duration in daily_data:
-                    total_time += duration
-                    app_usage[app] += duration
+        bounds = [(start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+                  for start, end in ((period1_start, period1_end), (period2_start, period2_end))]
+        totals = ([], [])
+        
+        # SQLite sums both periods in one grouped scan, each sorted by total time
+        for period, app_name, duration in self.db.get_app_totals_by_period(bounds):
+            totals[period].append((sys.intern(app_name), duration))
+        
+        def get_period_stats(bucket, start, end):
+            days = max((end - start).days + 1, 1)
+            total_time = sum(duration for _, duration in bucket)
             
             return {
                 'total_time': total_time,
-                'daily_average': total_time / days if days > 0 else 0,
-                'top_app': max(app_usage.items(), key=lambda x: x[1]) if app_usage else ('None', 0),
-                'app_count': len(app_usage)
+                'daily_average': total_time / days,
+                'top_app': bucket[0] if bucket else ('None', 0),
+                'app_count': len(bucket)
             }
         
-        period1 = get_period_stats(period1_start, period1_end)
-        period2 = get_period_stats(period2_start, period2_end)
+        period1 = get_period_stats(totals[0], period1_start, period1_end)
+        period2 = get_period_stats(totals[1], period2_start, period2_end)
         
         return period1, period2
 
 class AdvancedAnalyticsWidget(QWidget):
     """Advanced analytics widget with detailed insights"""
     
+    # Heatmap levels: 0h, 0-2h, 2-4h, 4-6h, 6-8h, 8+h (first bin catches exact 0)
+    HEATMAP_BINS = np.array([1e-9, 2, 4, 6, 8])
+    HEATMAP_LEGEND = ("0h", "0-2h", "2-4h", "4-6h", "6-8h", "8+h")
+    HEATMAP_PALETTE_LIGHT = ('#E5E5EA', '#C6F6D5', '#68D391', '#48BB78', '#38A169', '#2F855A')
+    HEATMAP_PALETTE_DARK = ('#2C2C2E', '#C6F6D5', '#68D391', '#48BB78', '#38A169', '#2F855A')
+    _heatmap_qss = {}  # {is_dark: stylesheet}
+    _legend_pixmaps = {}  # {(color, border): QPixmap}
+    _theme_qss = {}  # {ThemeColors: stylesheet}
+    TOP_APP_MEDALS = ("🥇", "🥈", "🥉", "4️⃣", "5️⃣")
+    
     def __init__(self, db_manager, theme_manager=None):
         super().__init__()
         self.db = db_manager
         self.theme = theme_manager
         self.analytics = AnalyticsManager(db_manager)
+        self._theme_colors = None
+        self._exporter = None
+        
+        # Coalesce bursts of period changes into one top-apps refresh
+        self._pending_period = "Today"
+        self._period_timer = QTimer(self)
+        self._period_timer.setSingleShot(True)
+        self._period_timer.timeout.connect(lambda: self.update_top_apps(self._pending_period))
         self.init_ui()
     
+    def _resolved_theme(self):
+        """Resolve the theme colors once and reuse them until the theme changes"""
+        if self._theme_colors is None:
+            theme = self.theme.get_current_theme() if self.theme else {}
+            is_dark = self.theme.dark_mode if self.theme else False
+            self._theme_colors = ThemeColors(
+                tc=theme.get('text_primary', '#FFFFFF' if is_dark else '#1C1C1E'),
+                tm=theme.get('text_muted', '#98989D' if is_dark else '#8E8E93'),
+                bg=theme.get('card_bg', '#1C1C1E' if is_dark else '#FFFFFF'),
+                is_dark=is_dark
+            )
+        return self._theme_colors
+    
     def init_ui(self):
-        theme = self.theme.get_current_theme() if self.theme else {}
-        is_dark = self.theme.dark_mode if self.theme else False
-        tc = theme.get('text_primary', '#FFFFFF' if is_dark else '#1C1C1E')
-        tm = theme.get('text_muted', '#98989D' if is_dark else '#8E8E93')
-        bg = theme.get('card_bg', '#1C1C1E' if is_dark else '#FFFFFF')
+        self._theme_colors = None
+        colors = self._resolved_theme()
+        
+        # Cards and labels are styled by role from one widget-level stylesheet
+        self.setStyleSheet(self.theme_stylesheet(colors))
         
         # Check if layout already exists and clear it
         if self.layout():
@@ -175,34 +248,34 @@ class AdvancedAnalyticsWidget(QWidget):
         scroll.setStyleSheet("QScrollArea {background-color: transparent; border: none;}")
         
         content = QWidget()
-        content.setStyleSheet("background-color: transparent;")
+        content.setObjectName("analytics_content")
         layout = QVBoxLayout(content)
         layout.setSpacing(20)
         layout.setContentsMargins(0, 0, 15, 0)
         
         # Title
         title = QLabel("📊 Advanced Analytics")
-        title.setStyleSheet(f"font-size:28px;font-weight:700;color:{tc};background-color:transparent;margin-bottom:10px")
+        title.setProperty("styleRole", "title_28")
         layout.addWidget(title)
         
         # Productivity Streak Card
-        streak_card = self.create_streak_card(bg, tc, tm)
+        streak_card = self.create_streak_card()
         layout.addWidget(streak_card)
         
         # Top Apps Card
-        top_apps_card = self.create_top_apps_card(bg, tc, tm)
+        top_apps_card = self.create_top_apps_card()
         layout.addWidget(top_apps_card)
         
         # Heatmap Card
-        heatmap_card = self.create_heatmap_card(bg, tc, tm, is_dark)
+        heatmap_card = self.create_heatmap_card(colors)
         layout.addWidget(heatmap_card)
         
         # Period Comparison Card
-        comparison_card = self.create_comparison_card(bg, tc, tm)
+        comparison_card = self.create_comparison_card()
         layout.addWidget(comparison_card)
         
         # Weekly Report Card
-        report_card = self.create_report_card(bg, tc, tm)
+        report_card = self.create_report_card()
         layout.addWidget(report_card)
         
         layout.addStretch()
@@ -211,15 +284,15 @@ class AdvancedAnalyticsWidget(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
     
-    def create_streak_card(self, bg, tc, tm):
+    def create_streak_card(self):
         """Create productivity streak card"""
         card = QFrame()
-        card.setStyleSheet(f"QFrame{{background-color:{bg};border-radius:12px;border:none}}")
+        card.setProperty("styleRole", "frame_card")
         layout = QVBoxLayout(card)
         layout.setContentsMargins(30, 24, 30, 24)
         
         self.streak_header = QLabel("🔥 Productivity Streak")
-        self.streak_header.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent")
+        self.streak_header.setProperty("styleRole", "header_18")
         layout.addWidget(self.streak_header)
         
         streak = self.analytics.get_productivity_streak()
@@ -230,99 +303,57 @@ class AdvancedAnalyticsWidget(QWidget):
         layout.addWidget(self.streak_value)
         
         self.streak_desc = QLabel(f"Keep it up! You've been productive for {streak} consecutive days.")
-        self.streak_desc.setStyleSheet(f"font-size:14px;color:{tm};background-color:transparent")
+        self.streak_desc.setProperty("styleRole", "desc_14")
         self.streak_desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.streak_desc.setWordWrap(True)
         layout.addWidget(self.streak_desc)
         
         return card
     
-    def create_top_apps_card(self, bg, tc, tm):
+    def create_top_apps_card(self):
         """Create top apps leaderboard card"""
         card = QFrame()
-        card.setStyleSheet(f"QFrame{{background-color:{bg};border-radius:12px;border:none}}")
+        card.setProperty("styleRole", "frame_card")
         layout = QVBoxLayout(card)
         layout.setContentsMargins(30, 24, 30, 24)
         
         # Header with period selector
         header_layout = QHBoxLayout()
         header = QLabel("🏆 Top 5 Apps")
-        header.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent")
+        header.setProperty("styleRole", "header_18")
         
         self.period_combo = QComboBox()
         self.period_combo.addItems(["Today", "This Week", "This Month"])
-        self.period_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: #007AFF;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 13px;
-                font-weight: 600;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-        """)
-        self.period_combo.currentTextChanged.connect(self.update_top_apps)
+        self.period_combo.setObjectName("period_combo")
+        self.period_combo.currentTextChanged.connect(self._on_period_changed)
         
         header_layout.addWidget(header)
         header_layout.addStretch()
         header_layout.addWidget(self.period_combo)
         layout.addLayout(header_layout)
         
-        # Top apps list
+        # Top apps list - a fixed pool of rows, refilled in place on every update
         self.top_apps_layout = QVBoxLayout()
         self.top_apps_layout.setSpacing(10)
         layout.addLayout(self.top_apps_layout)
         
-        self.update_top_apps("Today")
-        
-        return card
-    
-    def update_top_apps(self, period_text):
-        """Update top apps display"""
-        # Clear existing - properly delete widgets
-        while self.top_apps_layout.count():
-            item = self.top_apps_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                self.clear_layout_recursive(item.layout())
-        
-        # Get data
-        period_map = {"Today": "daily", "This Week": "weekly", "This Month": "monthly"}
-        period = period_map.get(period_text, "daily")
-        top_apps = self.analytics.get_top_apps(period=period)
-        
-        theme = self.theme.get_current_theme() if self.theme else {}
-        tc = theme.get('text_primary', '#FFFFFF' if self.theme.dark_mode else '#1C1C1E')
-        tm = theme.get('text_muted', '#98989D' if self.theme.dark_mode else '#8E8E93')
-        
-        medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
-        
-        for i, (app, duration) in enumerate(top_apps):
-            hours = duration // 3600
-            minutes = (duration % 3600) // 60
-            time_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-            
-            # Create a container widget for each row
+        self._top_app_rows = []
+        for medal in self.TOP_APP_MEDALS:
             row_widget = QWidget()
             row_widget.setStyleSheet("background-color: transparent;")
             app_row = QHBoxLayout(row_widget)
             app_row.setContentsMargins(0, 5, 0, 5)
             app_row.setSpacing(10)
             
-            medal_label = QLabel(medals[i])
+            medal_label = QLabel(medal)
             medal_label.setStyleSheet(f"font-size:24px;background-color:transparent")
             medal_label.setFixedWidth(40)
             
-            app_label = QLabel(app)
-            app_label.setStyleSheet(f"font-size:15px;font-weight:600;color:{tc};background-color:transparent")
+            app_label = QLabel()
+            app_label.setProperty("styleRole", "app_15")
             
-            time_label = QLabel(time_str)
-            time_label.setStyleSheet(f"font-size:15px;font-weight:600;color:{tm};background-color:transparent")
+            time_label = QLabel()
+            time_label.setProperty("styleRole", "time_15")
             time_label.setFixedWidth(80)
             time_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             
@@ -332,6 +363,33 @@ class AdvancedAnalyticsWidget(QWidget):
             app_row.addWidget(time_label)
             
             self.top_apps_layout.addWidget(row_widget)
+            self._top_app_rows.append((row_widget, app_label, time_label))
+        
+        self.update_top_apps("Today")
+        
+        return card
+    
+    def _on_period_changed(self, period_text):
+        """Schedule a debounced top apps refresh for the selected period"""
+        self._pending_period = period_text
+        self._period_timer.start(50)
+    
+    def update_top_apps(self, period_text):
+        """Update top apps display"""
+        # Get data
+        period_map = {"Today": "daily", "This Week": "weekly", "This Month": "monthly"}
+        period = period_map.get(period_text, "daily")
+        top_apps = self.analytics.get_top_apps(period=period, limit=len(self._top_app_rows))
+        
+        # Fill the pooled rows; styling is left to create/update_theme
+        for i, (row_widget, app_label, time_label) in enumerate(self._top_app_rows):
+            if i < len(top_apps):
+                app, duration = top_apps[i]
+                app_label.setText(app)
+                time_label.setText(_fmt_hm(duration))
+                row_widget.setVisible(True)
+            else:
+                row_widget.setVisible(False)
     
     def clear_layout_recursive(self, layout):
         """Recursively clear a layout and delete all widgets"""
@@ -342,38 +400,111 @@ class AdvancedAnalyticsWidget(QWidget):
             elif item.layout():
                 self.clear_layout_recursive(item.layout())
     
-    def create_heatmap_card(self, bg, tc, tm, is_dark):
+    @classmethod
+    def heatmap_palette(cls, is_dark):
+        """Heatmap colors indexed by activity level"""
+        return cls.HEATMAP_PALETTE_DARK if is_dark else cls.HEATMAP_PALETTE_LIGHT
+    
+    @classmethod
+    def heatmap_stylesheet(cls, is_dark):
+        """Stylesheet for all heatmap cells, built once per theme"""
+        qss = cls._heatmap_qss.get(is_dark)
+        if qss is None:
+            level_rules = "".join(
+                f"QFrame#heatmap_cell[level=\"{level}\"]{{background-color:{color}}}"
+                for level, color in enumerate(cls.heatmap_palette(is_dark))
+            )
+            qss = (
+                "QWidget{background-color:transparent}"
+                "QFrame#heatmap_cell{border:none;border-radius:8px}"
+                + level_rules +
+                "QLabel#heatmap_label{font-size:14px;font-weight:bold;color:#FFFFFF;background-color:transparent;border:none}"
+                "QLabel#heatmap_label[kind=\"hours\"]{font-size:12px;font-weight:600}"
+            )
+            cls._heatmap_qss[is_dark] = qss
+        return qss
+    
+    @staticmethod
+    def legend_border(is_dark):
+        """Border color of the heatmap legend swatches"""
+        return '#48484A' if is_dark else '#D1D1D6'
+    
+    @classmethod
+    def legend_swatch(cls, color, border):
+        """Rounded color swatch for the heatmap legend, painted once and shared"""
+        key = (color, border)
+        pixmap = cls._legend_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(40, 20)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(QPen(QColor(border), 1))
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(QRectF(0.5, 0.5, 39, 19), 4, 4)
+            painter.end()
+            cls._legend_pixmaps[key] = pixmap
+        return pixmap
+    
+    @classmethod
+    def theme_stylesheet(cls, colors):
+        """Stylesheet for every styled role in the widget, built once per theme"""
+        qss = cls._theme_qss.get(colors)
+        if qss is None:
+            tc, tm, bg, _ = colors
+            label_roles = {
+                "title_28": f"font-size:28px;font-weight:700;color:{tc};margin-bottom:10px",
+                "header_18": f"font-size:18px;font-weight:700;color:{tc}",
+                "big_32": f"font-size:32px;font-weight:800;color:{tc}",
+                "vs_24": f"font-size:24px;font-weight:800;color:{tm}",
+                "app_15": f"font-size:15px;font-weight:600;color:{tc}",
+                "time_15": f"font-size:15px;font-weight:600;color:{tm}",
+                "desc_14": f"font-size:14px;color:{tm}",
+                "change_14": f"font-size:14px;color:{tm};margin-top:15px",
+                "report_desc_14": f"font-size:14px;color:{tm};margin-bottom:15px",
+                "period_title_14": f"font-size:14px;font-weight:600;color:{tm}",
+                "legend_title_13": f"font-size:13px;font-weight:600;color:{tm}",
+                "small_12": f"font-size:12px;color:{tm}",
+                "legend_11": f"font-size:11px;color:{tm}",
+            }
+            qss = (
+                "QWidget#analytics_content{background-color:transparent}"
+                f"QFrame[styleRole=\"frame_card\"]{{background-color:{bg};border-radius:12px;border:none}}"
+                + "".join(
+                    f"QLabel[styleRole=\"{role}\"]{{{rule};background-color:transparent}}"
+                    for role, rule in label_roles.items()
+                ) +
+                "QComboBox#period_combo{background-color:#007AFF;color:white;border:none;border-radius:6px;"
+                "padding:6px 12px;font-size:13px;font-weight:600}"
+                "QComboBox#period_combo::drop-down{border:none}"
+            )
+            cls._theme_qss[colors] = qss
+        return qss
+    
+    def create_heatmap_card(self, colors):
         """Create activity heatmap card using Qt widgets instead of matplotlib"""
+        is_dark = colors.is_dark
         card = QFrame()
-        card.setStyleSheet(f"QFrame{{background-color:{bg};border-radius:12px;border:none}}")
+        card.setProperty("styleRole", "frame_card")
         layout = QVBoxLayout(card)
         layout.setContentsMargins(30, 24, 30, 24)
         
         header = QLabel("📅 Activity Heatmap (Last 30 Days)")
-        header.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent")
+        header.setProperty("styleRole", "header_18")
         layout.addWidget(header)
         
         # Get heatmap data
         data = self.analytics.get_heatmap_data(30)
         
-        # Color function
-        def get_color(hours):
-            if hours == 0:
-                return '#E5E5EA' if not is_dark else '#2C2C2E'
-            elif hours < 2:
-                return '#C6F6D5'
-            elif hours < 4:
-                return '#68D391'
-            elif hours < 6:
-                return '#48BB78'
-            elif hours < 8:
-                return '#38A169'
-            else:
-                return '#2F855A'
+        # Map every day to a color level in one vectorized lookup
+        palette = self.heatmap_palette(is_dark)
+        hours_arr = np.fromiter((d['hours'] for d in data), dtype=np.float64, count=len(data))
+        levels = np.searchsorted(self.HEATMAP_BINS, hours_arr, side='right')
         
-        # Create grid container
+        # Create grid container - one stylesheet styles every cell by level
         grid_container = QWidget()
-        grid_container.setStyleSheet("background-color: transparent;")
+        grid_container.setObjectName("heatmap_grid")
+        grid_container.setStyleSheet(self.heatmap_stylesheet(is_dark))
         grid_layout = QGridLayout(grid_container)
         grid_layout.setSpacing(8)
         grid_layout.setContentsMargins(0, 10, 0, 10)
@@ -386,22 +517,10 @@ class AdvancedAnalyticsWidget(QWidget):
             # Create cell widget
             cell = QFrame()
             cell.setFixedSize(120, 70)
-            bg_color = get_color(day_data['hours'])
             
             # IMPORTANT: Set object name so we can identify cells later
             cell.setObjectName("heatmap_cell")
-            
-            cell.setStyleSheet(f"""
-                QFrame#heatmap_cell {{
-                    background-color: {bg_color};
-                    border: none;
-                    border-radius: 8px;
-                }}
-                QLabel {{
-                    border: none;
-                    background-color: transparent;
-                }}
-            """)
+            cell.setProperty("level", int(levels[i]))
             
             cell_layout = QVBoxLayout(cell)
             cell_layout.setContentsMargins(5, 8, 5, 8)
@@ -411,15 +530,14 @@ class AdvancedAnalyticsWidget(QWidget):
             day_label = QLabel(day_data['day_name'][:2])
             day_label.setObjectName("heatmap_label")  # Mark as heatmap label
             day_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            day_label.setStyleSheet("QLabel#heatmap_label{font-size:14px;font-weight:bold;color:#FFFFFF;background-color:transparent;border:none}")
             cell_layout.addWidget(day_label)
             
             # Hours - always white text with !important-like specificity
             if day_data['hours'] > 0:
                 hours_label = QLabel(f"{day_data['hours']:.1f}h")
                 hours_label.setObjectName("heatmap_label")  # Mark as heatmap label
+                hours_label.setProperty("kind", "hours")
                 hours_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                hours_label.setStyleSheet("QLabel#heatmap_label{font-size:12px;font-weight:600;color:#FFFFFF;background-color:transparent;border:none}")
                 cell_layout.addWidget(hours_label)
             
             grid_layout.addWidget(cell, row, col)
@@ -430,25 +548,18 @@ class AdvancedAnalyticsWidget(QWidget):
         legend_layout = QHBoxLayout()
         legend_layout.setSpacing(15)
         legend_label = QLabel("Activity Level:")
-        legend_label.setStyleSheet(f"font-size:13px;font-weight:600;color:{tm};background-color:transparent")
+        legend_label.setProperty("styleRole", "legend_title_13")
         legend_layout.addWidget(legend_label)
         
-        colors = [
-            ("0h", "#E5E5EA" if not is_dark else "#2C2C2E"),
-            ("0-2h", "#C6F6D5"),
-            ("2-4h", "#68D391"),
-            ("4-6h", "#48BB78"),
-            ("6-8h", "#38A169"),
-            ("8+h", "#2F855A")
-        ]
-        
-        for label, color in colors:
+        for level, (label, color) in enumerate(zip(self.HEATMAP_LEGEND, palette)):
             color_box = QLabel()
+            color_box.setObjectName("legend_swatch")
+            color_box.setProperty("level", level)
             color_box.setFixedSize(40, 20)
-            color_box.setStyleSheet(f"background-color:{color};border-radius:4px;border:1px solid {'#48484A' if is_dark else '#D1D1D6'}")
+            color_box.setPixmap(self.legend_swatch(color, self.legend_border(is_dark)))
             
             text_label = QLabel(label)
-            text_label.setStyleSheet(f"font-size:11px;color:{tm};background-color:transparent")
+            text_label.setProperty("styleRole", "legend_11")
             
             legend_layout.addWidget(color_box)
             legend_layout.addWidget(text_label)
@@ -459,21 +570,21 @@ class AdvancedAnalyticsWidget(QWidget):
         return card
 
     
-    def create_comparison_card(self, bg, tc, tm):
+    def create_comparison_card(self):
         """Create period comparison card"""
         card = QFrame()
-        card.setStyleSheet(f"QFrame{{background-color:{bg};border-radius:12px;border:none}}")
+        card.setProperty("styleRole", "frame_card")
         layout = QVBoxLayout(card)
         layout.setContentsMargins(30, 24, 30, 24)
         
         self.comparison_header = QLabel("📊 This Week vs Last Week")
-        self.comparison_header.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent")
+        self.comparison_header.setProperty("styleRole", "header_18")
         layout.addWidget(self.comparison_header)
         
         # Calculate comparison
         today = datetime.now()
-        this_week_start = today - timedelta(days=7)
-        last_week_start = today - timedelta(days=14)
+        this_week_start = today - timedelta(days=6)
+        last_week_start = today - timedelta(days=13)
         last_week_end = today - timedelta(days=7)
         
         this_week, last_week = self.analytics.compare_periods(
@@ -484,17 +595,17 @@ class AdvancedAnalyticsWidget(QWidget):
         comp_layout = QHBoxLayout()
         
         # This week
-        this_week_widget = self.create_period_widget("This Week", this_week, tc, tm)
+        this_week_widget = self.create_period_widget("This Week", this_week)
         comp_layout.addWidget(this_week_widget)
         
         # VS label
         vs_label = QLabel("VS")
-        vs_label.setStyleSheet(f"font-size:24px;font-weight:800;color:{tm};background-color:transparent")
+        vs_label.setProperty("styleRole", "vs_24")
         vs_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         comp_layout.addWidget(vs_label)
         
         # Last week
-        last_week_widget = self.create_period_widget("Last Week", last_week, tc, tm)
+        last_week_widget = self.create_period_widget("Last Week", last_week)
         comp_layout.addWidget(last_week_widget)
         
         layout.addLayout(comp_layout)
@@ -504,50 +615,50 @@ class AdvancedAnalyticsWidget(QWidget):
         change_text = f"{'📈' if change > 0 else '📉'} {abs(change):.1f}% {'increase' if change > 0 else 'decrease'} from last week"
         
         self.comparison_change = QLabel(change_text)
-        self.comparison_change.setStyleSheet(f"font-size:14px;color:{tm};background-color:transparent;margin-top:15px")
+        self.comparison_change.setProperty("styleRole", "change_14")
         self.comparison_change.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.comparison_change)
         
         return card
     
-    def create_period_widget(self, title, stats, tc, tm):
+    def create_period_widget(self, title, stats):
         """Create a widget showing period statistics"""
         widget = QFrame()
         widget.setStyleSheet("QFrame {background-color: transparent; border: none;}")
         layout = QVBoxLayout(widget)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"font-size:14px;font-weight:600;color:{tm};background-color:transparent")
+        title_label.setProperty("styleRole", "period_title_14")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         hours = stats['total_time'] // 3600
         time_label = QLabel(f"{hours}h")
-        time_label.setStyleSheet(f"font-size:32px;font-weight:800;color:{tc};background-color:transparent")
+        time_label.setProperty("styleRole", "big_32")
         time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(time_label)
         
         top_app = stats['top_app'][0]
         top_app_label = QLabel(f"Top: {top_app}")
-        top_app_label.setStyleSheet(f"font-size:12px;color:{tm};background-color:transparent")
+        top_app_label.setProperty("styleRole", "small_12")
         top_app_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(top_app_label)
         
         return widget
     
-    def create_report_card(self, bg, tc, tm):
+    def create_report_card(self):
         """Create weekly report card"""
         card = QFrame()
-        card.setStyleSheet(f"QFrame{{background-color:{bg};border-radius:12px;border:none}}")
+        card.setProperty("styleRole", "frame_card")
         layout = QVBoxLayout(card)
         layout.setContentsMargins(30, 24, 30, 24)
         
         self.report_header = QLabel("📄 Reports")
-        self.report_header.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent")
+        self.report_header.setProperty("styleRole", "header_18")
         layout.addWidget(self.report_header)
         
         self.report_desc = QLabel("Generate detailed usage reports")
-        self.report_desc.setStyleSheet(f"font-size:14px;color:{tm};background-color:transparent;margin-bottom:15px")
+        self.report_desc.setProperty("styleRole", "report_desc_14")
         layout.addWidget(self.report_desc)
         
         # Report buttons
@@ -597,257 +708,93 @@ class AdvancedAnalyticsWidget(QWidget):
         
         return card
     
-    def generate_weekly_report(self):
-        """Generate weekly report"""
+    def _get_exporter(self):
+        """Create the data exporter on first use"""
+        if self._exporter is None:
+            from export_backup import DataExporter
+            self._exporter = DataExporter(self.db)
+        return self._exporter
+    
+    def _run_export(self, days, title):
+        """Ask for a format and export the last N days as a report"""
         try:
-            # Calculate date range for this week
+            # Calculate date range for the report
             today = datetime.now()
-            start_date = (today - timedelta(days=7)).strftime('%Y-%m-%d')
+            start_date = (today - timedelta(days=days - 1)).strftime('%Y-%m-%d')
             end_date = today.strftime('%Y-%m-%d')
             
             # Ask user for format
             msg = QMessageBox()
-            msg.setWindowTitle("Weekly Report")
-            msg.setText("Generate Weekly Report")
+            msg.setWindowTitle(f"{title} Report")
+            msg.setText(f"Generate {title} Report")
             msg.setInformativeText("Choose export format:")
             
-            csv_btn = msg.addButton("📄 CSV", QMessageBox.ButtonRole.ActionRole)
-            json_btn = msg.addButton("🗂️ JSON", QMessageBox.ButtonRole.ActionRole)
-            pdf_btn = msg.addButton("📑 PDF", QMessageBox.ButtonRole.ActionRole)
-            cancel_btn = msg.addButton(QMessageBox.StandardButton.Cancel)
+            buttons = {
+                msg.addButton("📄 CSV", QMessageBox.ButtonRole.ActionRole): 'csv',
+                msg.addButton("🗂️ JSON", QMessageBox.ButtonRole.ActionRole): 'json',
+                msg.addButton("📑 PDF", QMessageBox.ButtonRole.ActionRole): 'pdf',
+            }
+            msg.addButton(QMessageBox.StandardButton.Cancel)
             
             msg.exec()
-            clicked = msg.clickedButton()
-            
-            if clicked == cancel_btn:
+            fmt = buttons.get(msg.clickedButton())
+            if fmt is None:
                 return
             
-            # Create exporter
-            from export_backup import DataExporter
-            exporter = DataExporter(self.db)
-            
-            # Generate report based on choice
-            if clicked == csv_btn:
-                path, _ = QFileDialog.getSaveFileName(
-                    self, "Save Weekly Report",
-                    str(Path.home() / f"weekly_report_{datetime.now().strftime('%Y%m%d')}.csv"),
-                    "CSV Files (*.csv)"
-                )
-                if path:
-                    exporter.export_to_csv(path, start_date, end_date)
-                    QMessageBox.information(self, "Success", f"Weekly report saved:\n{path}")
-            
-            elif clicked == json_btn:
-                path, _ = QFileDialog.getSaveFileName(
-                    self, "Save Weekly Report",
-                    str(Path.home() / f"weekly_report_{datetime.now().strftime('%Y%m%d')}.json"),
-                    "JSON Files (*.json)"
-                )
-                if path:
-                    exporter.export_to_json(path, start_date, end_date)
-                    QMessageBox.information(self, "Success", f"Weekly report saved:\n{path}")
+            if fmt == 'pdf' and not PDF_AVAILABLE:
+                QMessageBox.warning(self, "PDF Unavailable",
+                    "PDF export requires reportlab library.\n\n"
+                    "Install with: pip install reportlab")
+                return
             
-            elif clicked == pdf_btn:
-                try:
-                    from reportlab.lib import colors
-                    PDF_AVAILABLE = True
-                except ImportError:
-                    PDF_AVAILABLE = False
-                
-                if not PDF_AVAILABLE:
-                    QMessageBox.warning(self, "PDF Unavailable",
-                        "PDF export requires reportlab library.\n\n"
-                        "Install with: pip install reportlab")
-                    return
-                
-                path, _ = QFileDialog.getSaveFileName(
-                    self, "Save Weekly Report",
-                    str(Path.home() / f"weekly_report_{datetime.now().strftime('%Y%m%d')}.pdf"),
-                    "PDF Files (*.pdf)"
-                )
-                if path:
-                    exporter.export_to_pdf(path, start_date, end_date)
-                    QMessageBox.information(self, "Success", f"Weekly report saved:\n{path}")
+            filename = f"{title.lower()}_report_{today.strftime('%Y%m%d')}.{fmt}"
+            path, _ = QFileDialog.getSaveFileName(
+                self, f"Save {title} Report",
+                str(Path.home() / filename),
+                f"{fmt.upper()} Files (*.{fmt})"
+            )
+            if path:
+                exporter = self._get_exporter()
+                export = getattr(exporter, f"export_to_{fmt}")
+                export(path, start_date, end_date)
+                QMessageBox.information(self, "Success", f"{title} report saved:\n{path}")
                     
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate report:\n{str(e)}")
     
+    def generate_weekly_report(self):
+        """Generate weekly report"""
+        self._run_export(7, "Weekly")
+    
     def generate_monthly_report(self):
         """Generate monthly report"""
-        try:
-            # Calculate date range for this month
-            today = datetime.now()
-            start_date = (today - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = today.strftime('%Y-%m-%d')
-            
-            # Ask user for format
-            msg = QMessageBox()
-            msg.setWindowTitle("Monthly Report")
-            msg.setText("Generate Monthly Report")
-            msg.setInformativeText("Choose export format:")
-            
-            csv_btn = msg.addButton("📄 CSV", QMessageBox.ButtonRole.ActionRole)
-            json_btn = msg.addButton("🗂️ JSON", QMessageBox.ButtonRole.ActionRole)
-            pdf_btn = msg.addButton("📑 PDF", QMessageBox.ButtonRole.ActionRole)
-            cancel_btn = msg.addButton(QMessageBox.StandardButton.Cancel)
-            
-            msg.exec()
-            clicked = msg.clickedButton()
-            
-            if clicked == cancel_btn:
-                return
-            
-            # Create exporter
-            from export_backup import DataExporter
-            exporter = DataExporter(self.db)
-            
-            # Generate report based on choice
-            if clicked == csv_btn:
-                path, _ = QFileDialog.getSaveFileName(
-                    self, "Save Monthly Report",
-                    str(Path.home() / f"monthly_report_{datetime.now().strftime('%Y%m%d')}.csv"),
-                    "CSV Files (*.csv)"
-                )
-                if path:
-                    exporter.export_to_csv(path, start_date, end_date)
-                    QMessageBox.information(self, "Success", f"Monthly report saved:\n{path}")
-            
-            elif clicked == json_btn:
-                path, _ = QFileDialog.getSaveFileName(
-                    self, "Save Monthly Report",
-                    str(Path.home() / f"monthly_report_{datetime.now().strftime('%Y%m%d')}.json"),
-                    "JSON Files (*.json)"
-                )
-                if path:
-                    exporter.export_to_json(path, start_date, end_date)
-                    QMessageBox.information(self, "Success", f"Monthly report saved:\n{path}")
-            
-            elif clicked == pdf_btn:
-                try:
-                    from reportlab.lib import colors
-                    PDF_AVAILABLE = True
-                except ImportError:
-                    PDF_AVAILABLE = False
-                
-                if not PDF_AVAILABLE:
-                    QMessageBox.warning(self, "PDF Unavailable",
-                        "PDF export requires reportlab library.\n\n"
-                        "Install with: pip install reportlab")
-                    return
-                
-                path, _ = QFileDialog.getSaveFileName(
-                    self, "Save Monthly Report",
-                    str(Path.home() / f"monthly_report_{datetime.now().strftime('%Y%m%d')}.pdf"),
-                    "PDF Files (*.pdf)"
-                )
-                if path:
-                    exporter.export_to_pdf(path, start_date, end_date)
-                    QMessageBox.information(self, "Success", f"Monthly report saved:\n{path}")
-                    
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to generate report:\n{str(e)}")
+        self._run_export(30, "Monthly")
     
-    def update_theme(self):
-        """Update theme by refreshing all styled elements"""
-        # Store current period selection if it exists
-        current_period = self.period_combo.currentText() if hasattr(self, 'period_combo') else "Today"
-        
-        # Get new theme colors
-        theme = self.theme.get_current_theme() if self.theme else {}
-        is_dark = self.theme.dark_mode if self.theme else False
-        tc = '#FFFFFF' if is_dark else '#1C1C1E'
-        tm = '#98989D' if is_dark else '#8E8E93'
-        bg = '#1C1C1E' if is_dark else '#FFFFFF'
-        border = '#48484A' if is_dark else '#E5E5EA'
-        
-        # Update scroll area styling
-        scroll = self.findChild(QScrollArea)
-        if scroll:
-            scroll.setStyleSheet("QScrollArea {background-color: transparent; border: none;}")
-        
-        # Update ALL cards (QFrame widgets) - BUT EXCLUDE HEATMAP CELLS
-        for card in self.findChildren(QFrame):
-            # Skip heatmap cells
-            if card.objectName() == "heatmap_cell":
-                continue
-            if card.layout():
-                card.setStyleSheet(f"QFrame{{background-color:{bg};border-radius:12px;border:none}}")
-        
-        # Update ALL labels by text matching - BUT SKIP HEATMAP LABELS
-        for label in self.findChildren(QLabel):
-            # Skip heatmap labels - they should always stay white
-            if label.objectName() == "heatmap_label":
-                continue
-                
-            text = label.text()
-            
-            # Main title
-            if "Advanced Analytics" in text or "📊 Advanced Analytics" in text:
-                label.setStyleSheet(f"font-size:28px;font-weight:700;color:{tc};background-color:transparent;margin-bottom:10px")
-            
-            # Section headers (18px)
-            elif any(header in text for header in ["🔥 Productivity Streak", "🏆 Top 5 Apps", "📅 Activity Heatmap", "📊 This Week vs Last Week", "📄 Reports"]):
-                label.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent")
-            
-            # Streak number (48px - keep orange)
-            elif "Days" in text and "font-size:48px" in label.styleSheet():
-                pass  # Keep original orange color
-            
-            # Period comparison large numbers (32px)
-            elif "h" in text and "font-size:32px" in label.styleSheet():
-                label.setStyleSheet(f"font-size:32px;font-weight:800;color:{tc};background-color:transparent")
-            
-            # VS label (24px)
-            elif text == "VS":
-                label.setStyleSheet(f"font-size:24px;font-weight:800;color:{tm};background-color:transparent")
-            
-            # App names and times (15px)
-            elif "font-size:15px" in label.styleSheet():
-                if label.alignment() & Qt.AlignmentFlag.AlignRight:
-                    # Time labels (right-aligned)
-                    label.setStyleSheet(f"font-size:15px;font-weight:600;color:{tm};background-color:transparent")
-                else:
-                    # App names
-                    label.setStyleSheet(f"font-size:15px;font-weight:600;color:{tc};background-color:transparent")
-            
-            # Description text (14px)
-            elif "font-size:14px" in label.styleSheet():
-                label.setStyleSheet(f"font-size:14px;color:{tm};background-color:transparent")
-            
-            # Small labels (12px) - period widget labels
-            elif "font-size:12px" in label.styleSheet():
-                label.setStyleSheet(f"font-size:12px;color:{tm};background-color:transparent")
-            
-            # Legend text (11px)
-            elif "font-size:11px" in label.styleSheet():
-                label.setStyleSheet(f"font-size:11px;color:{tm};background-color:transparent")
-        
-        # Update period combo box
-        if hasattr(self, 'period_combo'):
-            self.period_combo.setStyleSheet(f"""
-                QComboBox {{
-                    background-color: #007AFF;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 6px 12px;
-                    font-size: 13px;
-                    font-weight: 600;
-                }}
-                QComboBox::drop-down {{
-                    border: none;
-                }}
-            """)
-            # Restore selection
-            index = self.period_combo.findText(current_period)
-            if index >= 0:
-                self.period_combo.setCurrentIndex(index)
-        
-        # Force refresh of top apps list
-        if hasattr(self, 'period_combo'):
-            self.update_top_apps(self.period_combo.currentText())
-        
-        # Force visual update
-        self.update()
+    def update_theme(self, force=False):
+        """Update theme by swapping the role stylesheet in a single pass"""
+        previous = self._theme_colors
+        self._theme_colors = None
+        colors = self._resolved_theme()
+        if colors == previous and not force:
+            return  # Theme colors unchanged, nothing to restyle
+        
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(self.theme_stylesheet(colors))
+            
+            # The heatmap keeps its own per-theme styling; reach it by object name
+            grid = self.findChild(QWidget, "heatmap_grid")
+            if grid:
+                grid.setStyleSheet(self.heatmap_stylesheet(colors.is_dark))
+            palette = self.heatmap_palette(colors.is_dark)
+            border = self.legend_border(colors.is_dark)
+            for swatch in self.findChildren(QLabel, "legend_swatch"):
+                swatch.setPixmap(self.legend_swatch(palette[swatch.property("level")], border))
+            
+            # Force refresh of top apps list
+            if hasattr(self, 'period_combo'):
+                self.update_top_apps(self.period_combo.currentText())
+        finally:
+            self.setUpdatesEnabled(True)
 
 __all__ = ['AdvancedAnalyticsWidget', 'AnalyticsManager']
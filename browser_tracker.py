@@ -4,17 +4,64 @@ Browser Tracker Module for Puthu Tracker
 Enhanced browser monitoring with tab tracking capabilities
 """
 
+import atexit
 import json
+import http.client
 import sqlite3
 import subprocess
 import re
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
 import psutil
 
+# Common window title patterns for different browsers, combined into one regex.
+# Each branch is an anchored lookahead, so branches are tried in priority order
+# (a URL anywhere wins over a browser suffix) and each finds its leftmost match.
+_TITLE_RE = re.compile(
+    r'(?=.*?(?P<url>https?://[^\s\-]+))'  # Direct URL pattern
+    r'|(?=.*?(?P<chrome>[^-]+) - Google Chrome)'  # Chrome pattern
+    r'|(?=.*?(?P<firefox>[^-]+) - Mozilla Firefox)'  # Firefox pattern
+    r'|(?=.*?(?P<edge>[^-]+) - Microsoft Edge)',  # Edge pattern
+    re.DOTALL
+)
+
+_DOMAIN_PATTERNS = [re.compile(p) for p in (
+    r'https?://(?:www\.)?([^/]+)',
+    r'([a-zA-Z0-9-]+\.[a-zA-Z]{2,})',
+)]
+
+# Keep-alive connections to local browser debug ports: {port: HTTPConnection}
+_debug_connections = {}
+
+def _fetch_debug_tabs(port):
+    """Fetch (title, url) tabs from a browser remote-debugging port on localhost"""
+    conn = _debug_connections.get(port)
+    if conn is None:
+        conn = _debug_connections[port] = http.client.HTTPConnection('localhost', port, timeout=1)
+    
+    try:
+        conn.request('GET', '/json/tabs')
+        response = conn.getresponse()
+        body = response.read()
+    except (OSError, http.client.HTTPException):
+        # Drop the broken connection; the next poll reconnects
+        conn.close()
+        _debug_connections.pop(port, None)
+        return []
+    
+    if response.status != 200:
+        return []
+    return [(tab.get('title', 'Unknown'), tab.get('url', '')) for tab in json.loads(body)]
+
 class BrowserTracker:
     """Enhanced browser tracking with tab title extraction"""
     
+    ACTIVE_TABS_TTL = 0.5  # Seconds a tab list fetch is reused
+    FLUSH_INTERVAL = 5.0  # Seconds between batched browser usage writes
+    
     def __init__(self, db_manager):
         self.db_manager = db_manager
         self.supported_browsers = {
@@ -26,6 +73,10 @@ class BrowserTracker:
             'iexplore.exe': 'Internet Explorer'
         }
         self.current_browser_session = None
+        self._tab_cache = {}  # {browser_name: (monotonic time, tabs)}
+        self._pending = []  # Browser sessions waiting to be written
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
     
     def is_browser(self, app_name):
         """Check if the application is a supported browser"""
@@ -37,22 +88,25 @@ class BrowserTracker:
     
     def extract_url_from_title(self, window_title):
         """Extract URL information from browser window title"""
-        # Common patterns for different browsers
-        patterns = [
-            r'https?://[^\s\-]+',  # Direct URL pattern
-            r'([^-]+) - Google Chrome',  # Chrome pattern
-            r'([^-]+) - Mozilla Firefox',  # Firefox pattern
-            r'([^-]+) - Microsoft Edge',  # Edge pattern
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, window_title)
-            if match:
-                return match.group(1).strip()
+        match = _TITLE_RE.match(window_title)
+        if match:
+            return match.group(match.lastgroup).strip()
         
         return window_title
     
     def get_active_tabs(self, browser_name):
+        """Get active tabs, reusing a fetch from the last ACTIVE_TABS_TTL seconds"""
+        now = time.monotonic()
+        cached = self._tab_cache.get(browser_name)
+        if cached and now - cached[0] < self.ACTIVE_TABS_TTL:
+            return cached[1]
+        
+        # Failed fetches are cached too, so bursts don't each wait out a timeout
+        tabs = self._fetch_active_tabs(browser_name)
+        self._tab_cache[browser_name] = (now, tabs)
+        return tabs
+    
+    def _fetch_active_tabs(self, browser_name):
         """Get active tabs for supported browsers (Windows-specific)"""
         try:
             if 'chrome' in browser_name.lower():
@@ -70,11 +124,7 @@ class BrowserTracker:
         """Get Chrome tabs using debugging port (if enabled)"""
         try:
             # This requires Chrome to be started with --remote-debugging-port=9222
-            import requests
-            response = requests.get('http://localhost:9222/json/tabs', timeout=1)
-            if response.status_code == 200:
-                tabs = response.json()
-                return [(tab.get('title', 'Unknown'), tab.get('url', '')) for tab in tabs]
+            return _fetch_debug_tabs(9222)
         except:
             pass
         return []
@@ -87,11 +137,7 @@ class BrowserTracker:
     def _get_edge_tabs(self):
         """Get Edge tabs using similar method to Chrome"""
         try:
-            import requests
-            response = requests.get('http://localhost:9223/json/tabs', timeout=1)
-            if response.status_code == 200:
-                tabs = response.json()
-                return [(tab.get('title', 'Unknown'), tab.get('url', '')) for tab in tabs]
+            return _fetch_debug_tabs(9223)
         except:
             pass
         return []
@@ -105,74 +151,88 @@ class BrowserTracker:
         url = ""
         active_tabs = self.get_active_tabs(browser_name)
         if active_tabs:
-            # Find matching tab
-            for title, tab_url in active_tabs:
-                if title in window_title or window_title in title:
-                    url = tab_url
-                    break
+            # Exact title match first, substring scan only on a miss
+            url = dict(active_tabs).get(window_title, "")
+            if not url:
+                for title, tab_url in active_tabs:
+                    if title and (title in window_title or window_title in title):
+                        url = tab_url
+                        break
         
-        # Save to database
-        self.db_manager.save_browser_usage(
+        # Buffer the row; flush() writes the batch in one transaction
+        self._pending.append((
             browser_name,
             tab_title,
             url,
             start_time.isoformat() if isinstance(start_time, datetime) else start_time,
             end_time.isoformat() if isinstance(end_time, datetime) else end_time,
-            duration
-        )
+            duration,
+            self.db_manager.today(),
+            # Stored once so stats can group by it in SQL; '' means no domain found
+            self._extract_domain(tab_title) or ''
+        ))
+        self.flush_if_due()
+    
+    def flush_if_due(self):
+        """Flush buffered sessions once FLUSH_INTERVAL has passed since the last write"""
+        if self._pending and time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered browser sessions to the database"""
+        self._last_flush = time.monotonic()
+        if self._pending:
+            rows, self._pending = self._pending, []
+            self.db_manager.save_browser_usage_batch(rows)
+    
+    def discard_pending(self):
+        """Drop buffered sessions without writing them, e.g. before the data is wiped"""
+        self._pending = []
+        self._last_flush = time.monotonic()
     
     def get_browser_stats(self, date=None):
         """Get browser usage statistics"""
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = self.db_manager.today()
         
-        browser_data = self.db_manager.get_browser_usage_by_date(date)
+        self.flush()
+        browser_totals = self.db_manager.get_browser_totals_by_date(date)
         
-        # Process data for analytics
+        # SQLite does the per-browser and per-domain sums
         stats = {
-            'total_browser_time': 0,
-            'browsers_used': set(),
+            'total_browser_time': sum(duration for _, duration in browser_totals),
+            'browsers_used': {browser_name for browser_name, _ in browser_totals},
             'most_visited_sites': {},
-            'browser_breakdown': {}
+            'browser_breakdown': dict(browser_totals)
         }
         
-        for browser_name, tab_title, duration in browser_data:
-            stats['total_browser_time'] += duration
-            stats['browsers_used'].add(browser_name)
-            
-            if browser_name not in stats['browser_breakdown']:
-                stats['browser_breakdown'][browser_name] = 0
-            stats['browser_breakdown'][browser_name] += duration
-            
-            # Extract domain from tab title for site stats
-            domain = self._extract_domain(tab_title)
+        sites = Counter()
+        for domain, tab_title, duration in self.db_manager.get_domain_totals_by_date(date):
+            if domain is None:
+                # Legacy row without a stored domain
+                domain = self._extract_domain(tab_title) if tab_title else None
             if domain:
-                if domain not in stats['most_visited_sites']:
-                    stats['most_visited_sites'][domain] = 0
-                stats['most_visited_sites'][domain] += duration
+                sites[domain] += duration
         
         # Convert set to list for JSON serialization
         stats['browsers_used'] = list(stats['browsers_used'])
         
         # Sort most visited sites
-        stats['most_visited_sites'] = dict(sorted(
-            stats['most_visited_sites'].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        ))
+        stats['most_visited_sites'] = dict(sites.most_common())
         
         return stats
     
     def _extract_domain(self, title_or_url):
         """Extract domain from title or URL"""
-        # Simple domain extraction
-        patterns = [
-            r'https?://(?:www\.)?([^/]+)',
-            r'([a-zA-Z0-9-]+\.[a-zA-Z]{2,})',
-        ]
+        # Plain URLs go straight through urlsplit
+        if title_or_url.startswith(('http://', 'https://')):
+            netloc = urlsplit(title_or_url).netloc
+            if netloc:
+                return netloc[4:] if netloc.startswith('www.') else netloc
         
-        for pattern in patterns:
-            match = re.search(pattern, title_or_url)
+        # Simple domain extraction
+        for pattern in _DOMAIN_PATTERNS:
+            match = pattern.search(title_or_url)
             if match:
                 return match.group(1)
         
@@ -181,15 +241,18 @@ class BrowserTracker:
 class ProductivityAnalyzer:
     """Analyze productivity based on application usage"""
     
-    def __init__(self, category_manager=None):
-        # Use shared category manager if provided, otherwise load default categories
-        self.category_manager = category_manager
-        if not category_manager:
-            self.productivity_categories = self._load_categories()
+    CATEGORY_WEIGHTS = {
+        'productive': 1.0,
+        'neutral': 0.5,
+        'entertainment': -0.3,
+        'social': -0.2,
+        'uncategorized': 0.0
+    }
     
-    def _load_categories(self):
-        """Load productivity categories (fallback if no category_manager)"""
-        return {
+    # Fallback categories (when no category_manager), lowercased and frozen once
+    DEFAULT_CATEGORIES = {
+        category: frozenset(app.lower() for app in apps)
+        for category, apps in {
             'productive': [
                 'code.exe', 'devenv.exe', 'pycharm64.exe', 'idea64.exe',
                 'sublime_text.exe', 'notepad++.exe', 'atom.exe', 'vscode.exe',
@@ -208,7 +271,14 @@ class ProductivityAnalyzer:
                 'whatsapp.exe', 'telegram.exe', 'skype.exe', 'facebook.exe',
                 'instagram.exe', 'twitter.exe', 'linkedin.exe'
             ]
-        }
+        }.items()
+    }
+    
+    def __init__(self, category_manager=None):
+        # Use shared category manager if provided, otherwise the default categories
+        self.category_manager = category_manager
+        if not category_manager:
+            self.productivity_categories = self.DEFAULT_CATEGORIES
     
     def categorize_app(self, app_name):
         """Categorize application by productivity"""
@@ -225,29 +295,27 @@ class ProductivityAnalyzer:
         
         return 'uncategorized'
     
-    def calculate_productivity_score(self, usage_data):
-        """Calculate productivity score based on usage"""
-        category_weights = {
-            'productive': 1.0,
-            'neutral': 0.5,
-            'entertainment': -0.3,
-            'social': -0.2,
-            'uncategorized': 0.0
-        }
-        
-        total_time = 0
-        weighted_score = 0
+    def _time_by_category(self, usage_data):
+        """Total duration per category, categorizing each app once"""
+        categorized_time = dict.fromkeys(self.CATEGORY_WEIGHTS, 0)
         
         for app_name, duration in usage_data:
             category = self.categorize_app(app_name)
-            weight = category_weights.get(category, 0.0)
-            
-            total_time += duration
-            weighted_score += duration * weight
+            categorized_time[category] = categorized_time.get(category, 0) + duration
         
+        return categorized_time
+    
+    def _score_from_breakdown(self, categorized_time):
+        """Productivity score from per-category totals"""
+        total_time = sum(categorized_time.values())
         if total_time == 0:
             return 50  # Neutral score
         
+        weighted_score = sum(
+            time * self.CATEGORY_WEIGHTS.get(category, 0.0)
+            for category, time in categorized_time.items()
+        )
+        
         # Normalize to 0-100 scale
         raw_score = (weighted_score / total_time) * 100
         # Adjust to make 50 the neutral point
@@ -255,24 +323,18 @@ class ProductivityAnalyzer:
         
         return round(productivity_score, 1)
     
+    def calculate_productivity_score(self, usage_data):
+        """Calculate productivity score based on usage"""
+        return self._score_from_breakdown(self._time_by_category(usage_data))
+    
     def get_productivity_insights(self, usage_data):
         """Get detailed productivity insights"""
-        categorized_time = {
-            'productive': 0,
-            'neutral': 0,
-            'entertainment': 0,
-            'social': 0,
-            'uncategorized': 0
-        }
-        
-        for app_name, duration in usage_data:
-            category = self.categorize_app(app_name)
-            categorized_time[category] += duration
-        
+        # One categorization pass feeds both the score and the breakdown
+        categorized_time = self._time_by_category(usage_data)
         total_time = sum(categorized_time.values())
         
         insights = {
-            'productivity_score': self.calculate_productivity_score(usage_data),
+            'productivity_score': self._score_from_breakdown(categorized_time),
             'time_breakdown': categorized_time,
             'time_percentages': {
                 category: round((time / total_time * 100), 1) if total_time > 0 else 0
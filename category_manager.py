@@ -5,10 +5,34 @@ Category Manager - Helper for managing app categories inline
 
 import json
 import os
+import re
 from PyQt6.QtWidgets import QComboBox, QSizePolicy
-from PyQt6.QtCore import Qt, QSize, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, QObject, QStringListModel, QTimer, pyqtSignal
 from PyQt6.QtGui import QCursor
 
+try:
+    import orjson  # Optional fast JSON encoder
+except ImportError:
+    orjson = None
+
+# Parsed categories files shared across managers: {(path, mtime): categories}
+_categories_cache = {}
+
+# Category combo stylesheets keyed by the theme colors they use
+_combo_style_cache = {}
+
+
+def _copy_categories(categories):
+    """Copy a categories dict so callers can't mutate the cached pattern lists"""
+    return {category: list(apps) for category, apps in categories.items()}
+
+
+def _forget_categories(path):
+    """Drop cached parses of a categories file"""
+    for key in [key for key in _categories_cache if key[0] == path]:
+        del _categories_cache[key]
+
+
 class CategoryManager(QObject):
     """Manages app categories and provides utilities for category dropdowns"""
     
@@ -19,18 +43,30 @@ class CategoryManager(QObject):
         super().__init__()
         self.categories_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app_categories.json')
         self.app_categories = self.load_categories()
+        self._rebuild_index()
+        self._updated_pending = False
+        # One item model shared by every category combo this manager creates
+        self._category_model = QStringListModel(['Productive', 'Entertainment', 'Neutral', 'Social', 'Other'], self)
     
     def load_categories(self):
         """Load app categories from JSON file"""
         if os.path.exists(self.categories_file):
             try:
-                with open(self.categories_file, 'r') as f:
+                # Reuse the parsed file while it is unchanged on disk
+                key = (self.categories_file, os.path.getmtime(self.categories_file))
+                cached = _categories_cache.get(key)
+                if cached is not None:
+                    return _copy_categories(cached)
+                
+                with open(self.categories_file, 'r', encoding='utf-8') as f:
                     categories = json.load(f)
                     # Ensure all required categories exist
                     default_cats = self.get_default_categories()
                     for cat in default_cats:
                         if cat not in categories:
                             categories[cat] = default_cats[cat]
+                    _forget_categories(self.categories_file)
+                    _categories_cache[key] = _copy_categories(categories)
                     return categories
             except Exception as e:
                 print(f"Error loading categories: {e}")
@@ -54,26 +90,69 @@ class CategoryManager(QObject):
     def save_categories(self):
         """Save categories to JSON file"""
         try:
-            with open(self.categories_file, 'w') as f:
-                json.dump(self.app_categories, f, indent=2)
+            # Write a temp file and swap it in so a crash never leaves a truncated file
+            tmp_file = self.categories_file + '.tmp'
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.app_categories, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.app_categories, f, indent=2)
+            os.replace(tmp_file, self.categories_file)
+            _forget_categories(self.categories_file)
             return True
         except Exception as e:
             print(f"Error saving categories: {e}")
             return False
     
-    def get_app_category(self, app_name):
-        """Get category for an app"""
-        app_lower = app_name.lower().replace('.exe', '')
-        
+    def _scan_category(self, app_lower):
+        """First category (in order) with a pattern contained in the app name"""
         for category, apps in self.app_categories.items():
             for pattern in apps:
                 if pattern.lower() in app_lower:
                     return category
+        return 'uncategorized'
+    
+    def _rebuild_index(self):
+        """Rebuild the pattern lookup tables after categories change"""
+        # Exact pattern -> category, resolved with the same precedence as a full scan
+        self._pattern_to_cat = {}
+        for apps in self.app_categories.values():
+            for pattern in apps:
+                pattern = pattern.lower()
+                if pattern not in self._pattern_to_cat:
+                    self._pattern_to_cat[pattern] = self._scan_category(pattern)
+        
+        self._cat_cache = {}
+        
+        # One substring regex per category, checked in category order
+        self._category_res = [
+            (category, re.compile("|".join(re.escape(p.lower()) for p in apps)))
+            for category, apps in self.app_categories.items() if apps
+        ]
+    
+    def get_app_category(self, app_name):
+        """Get category for an app (memoized until categories change)"""
+        category = self._cat_cache.get(app_name)
+        if category is None:
+            category = self._lookup_category(app_name.lower().replace('.exe', ''))
+            self._cat_cache[app_name] = category
+        return category
+    
+    def _lookup_category(self, app_lower):
+        """Resolve a normalized app name through the pattern index"""
+        category = self._pattern_to_cat.get(app_lower)
+        if category is not None:
+            return category
+        
+        for category, pattern_re in self._category_res:
+            if pattern_re.search(app_lower):
+                return category
         
         return 'uncategorized'
     
-    def update_app_category(self, app_name, new_category):
-        """Update category for an app"""
+    def _assign_category(self, app_name, new_category):
+        """Move an app's pattern into a category (in memory only)"""
         # Clean app name
         app_pattern = app_name.lower().replace('.exe', '').strip()
         
@@ -88,20 +167,44 @@ class CategoryManager(QObject):
         
         if app_pattern not in self.app_categories[new_category]:
             self.app_categories[new_category].append(app_pattern)
+    
+    def update_app_category(self, app_name, new_category):
+        """Update category for an app"""
+        return self.bulk_update([(app_name, new_category)])
+    
+    def bulk_update(self, assignments):
+        """Apply several (app_name, category) updates with one rebuild, save and signal"""
+        for app_name, new_category in assignments:
+            self._assign_category(app_name, new_category)
+        
+        self._rebuild_index()
         
         # Save changes
         result = self.save_categories()
         
-        # Emit signal to notify listeners that categories have changed
+        # Notify listeners that categories have changed
         if result:
-            self.categories_updated.emit()
+            self._schedule_updated()
         
         return result
     
+    def _schedule_updated(self):
+        """Emit categories_updated once per event-loop pass, however many updates land"""
+        if self._updated_pending:
+            return
+        self._updated_pending = True
+        QTimer.singleShot(0, self._emit_updated)
+    
+    def _emit_updated(self):
+        """Deliver the coalesced categories_updated signal"""
+        self._updated_pending = False
+        self.categories_updated.emit()
+    
     def create_category_combo(self, app_name, theme, is_dark, on_change_callback=None):
         """Create a styled combo box for category selection"""
         combo = QComboBox()
-        combo.addItems(['Productive', 'Entertainment', 'Neutral', 'Social', 'Other'])
+        combo.setModel(self._category_model)
+        combo.view().setUniformItemSizes(True)
         
         # Set current selection
         current_category = self.get_app_category(app_name)
@@ -127,7 +230,15 @@ class CategoryManager(QObject):
         return combo
     
     def get_combo_style(self, theme, is_dark):
-        """Get combo box style"""
+        """Get combo box style, built once per distinct set of theme colors"""
+        key = (theme['panel_bg'], theme['border'], theme['text_primary'], theme.get('table_hover', theme['panel_bg']))
+        style = _combo_style_cache.get(key)
+        if style is None:
+            style = _combo_style_cache[key] = self._build_combo_style(theme)
+        return style
+    
+    def _build_combo_style(self, theme):
+        """Format the combo box stylesheet for a theme"""
         return f"""
             QComboBox {{
                 background-color: {theme['panel_bg']};
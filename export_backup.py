@@ -3,6 +3,7 @@
 
 import csv
 import json
+import os
 import shutil
 import sqlite3
 from datetime import datetime
@@ -20,15 +21,81 @@ try:
     from reportlab.lib.units import inch
     from reportlab.lib.enums import TA_CENTER
     PDF_AVAILABLE = True
+    
+    # Report styles are immutable once built, so every export shares them
+    PDF_STYLES = getSampleStyleSheet()
+    PDF_TITLE_STYLE = ParagraphStyle(
+        'Title', parent=PDF_STYLES['Heading1'], fontSize=24,
+        textColor=colors.HexColor('#007AFF'), spaceAfter=30, alignment=TA_CENTER
+    )
+    PDF_SUMMARY_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#007AFF')),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('GRID', (0,0), (-1,-1), 1, colors.black)
+    ])
+    PDF_APPS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#34C759')),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('GRID', (0,0), (-1,-1), 1, colors.black)
+    ])
 except ImportError:
     PDF_AVAILABLE = False
 
+try:
+    import orjson  # Optional fast JSON encoder
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd  # Optional backup compression
+except ImportError:
+    zstd = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+else:
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+class TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """Runs an export/backup callable on the global thread pool"""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = TaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class ExportBackupWidget(QWidget):
+    about_to_restore = pyqtSignal()  # The database file is about to be replaced
+    backup_restored = pyqtSignal()  # The database file was replaced by a backup
+    _theme_qss = {}  # {is_dark: stylesheet}
+    
     def __init__(self, db_manager, theme_manager=None):
         super().__init__()
         self.db_manager = db_manager
         self.theme_manager = theme_manager
         self.backup_manager = BackupManager(db_manager)
+        self.exporter = DataExporter(db_manager)
+        self._backup_info_pending = False
+        self._file_dialog = None
+        self._home = Path.home()
         self.init_ui()
     
     def init_ui(self):
@@ -38,7 +105,7 @@ class ExportBackupWidget(QWidget):
         
         # Title
         title = QLabel("📤 Export & Backup")
-        self.apply_title_styling(title)
+        title.setProperty("styleRole", "page_title")
         layout.addWidget(title)
         
         # Export Section
@@ -52,32 +119,20 @@ class ExportBackupWidget(QWidget):
         
         layout.addStretch()
         self.setLayout(layout)
-    
-    def apply_title_styling(self, label):
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        text_color = theme.get('text_primary', '#1C1C1E')
-        label.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: 900;
-            color: {text_color};
-            background-color: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
+        self.update_theme()
     
     def create_export_section(self):
         section = QFrame()
-        self.apply_section_styling(section)
+        section.setProperty("styleRole", "section")
         layout = QVBoxLayout(section)
         layout.setContentsMargins(25, 25, 25, 25)
         
         self.export_title = QLabel("📊 Export Data")
-        self.apply_section_title_styling(self.export_title)
+        self.export_title.setProperty("styleRole", "section_title")
         layout.addWidget(self.export_title)
         
         self.export_desc = QLabel("Export your tracking data for analysis")
-        self.apply_description_styling(self.export_desc)
+        self.export_desc.setProperty("styleRole", "description")
         layout.addWidget(self.export_desc)
         
         # Export buttons
@@ -103,21 +158,19 @@ class ExportBackupWidget(QWidget):
         # Date range
         date_layout = QHBoxLayout()
         self.from_label = QLabel("From:")
-        self.apply_label_styling(self.from_label)
+        self.from_label.setProperty("styleRole", "field_label")
         date_layout.addWidget(self.from_label)
         
         self.start_date = QDateEdit(QDate.currentDate().addDays(-30))
         self.start_date.setCalendarPopup(True)
-        self.apply_date_styling(self.start_date)
         date_layout.addWidget(self.start_date)
         
         self.to_label = QLabel("To:")
-        self.apply_label_styling(self.to_label)
+        self.to_label.setProperty("styleRole", "field_label")
         date_layout.addWidget(self.to_label)
         
         self.end_date = QDateEdit(QDate.currentDate())
         self.end_date.setCalendarPopup(True)
-        self.apply_date_styling(self.end_date)
         date_layout.addWidget(self.end_date)
         date_layout.addStretch()
         
@@ -126,20 +179,20 @@ class ExportBackupWidget(QWidget):
     
     def create_backup_section(self):
         section = QFrame()
-        self.apply_section_styling(section)
+        section.setProperty("styleRole", "section")
         layout = QVBoxLayout(section)
         layout.setContentsMargins(25, 25, 25, 25)
         
         self.backup_title = QLabel("💾 Backup Management")
-        self.apply_section_title_styling(self.backup_title)
+        self.backup_title.setProperty("styleRole", "section_title")
         layout.addWidget(self.backup_title)
         
         # Info
         info_layout = QHBoxLayout()
         self.last_backup_label = QLabel("Last: Never")
-        self.apply_label_styling(self.last_backup_label)
+        self.last_backup_label.setProperty("styleRole", "field_label")
         self.backup_count_label = QLabel("Total: 0")
-        self.apply_label_styling(self.backup_count_label)
+        self.backup_count_label.setProperty("styleRole", "field_label")
         info_layout.addWidget(self.last_backup_label)
         info_layout.addWidget(self.backup_count_label)
         info_layout.addStretch()
@@ -164,12 +217,12 @@ class ExportBackupWidget(QWidget):
     
     def create_restore_section(self):
         section = QFrame()
-        self.apply_section_styling(section)
+        section.setProperty("styleRole", "section")
         layout = QVBoxLayout(section)
         layout.setContentsMargins(25, 25, 25, 25)
         
         self.restore_title = QLabel("📥 Import & Restore")
-        self.apply_section_title_styling(self.restore_title)
+        self.restore_title.setProperty("styleRole", "section_title")
         layout.addWidget(self.restore_title)
         
         restore_btn = self.create_button("♻️ Restore Backup", "#FF3B30")
@@ -177,112 +230,11 @@ class ExportBackupWidget(QWidget):
         layout.addWidget(restore_btn)
         
         self.warning_label = QLabel("⚠️ Warning: Restoring will replace all current data")
-        self.apply_warning_styling(self.warning_label)
+        self.warning_label.setProperty("styleRole", "warning")
         layout.addWidget(self.warning_label)
         
         return section
     
-    def apply_section_styling(self, section):
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        if is_dark:
-            bg = '#1C1C1E'
-            border = '#38383A'
-        else:
-            bg = '#FFFFFF'
-            border = '#E5E5EA'
-        
-        section.setStyleSheet(f"QFrame {{background-color: {bg}; border: 1px solid {border}; border-radius: 12px;}}")
-    
-    def apply_section_title_styling(self, label):
-        """Apply section title styling based on theme"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        text_color = '#FFFFFF' if is_dark else '#1C1C1E'
-        
-        label.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 700;
-            color: {text_color};
-            background-color: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
-    
-    def apply_description_styling(self, label):
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        text_muted = theme.get('text_muted', '#8E8E93')
-        label.setStyleSheet(f"""
-            font-size: 14px;
-            color: {text_muted};
-            background-color: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
-    
-    def apply_label_styling(self, label):
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        text_color = '#FFFFFF' if is_dark else '#1C1C1E'
-        
-        label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {text_color};
-            background-color: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
-    
-    def apply_warning_styling(self, label):
-        label.setStyleSheet("""
-            color: #FF3B30;
-            font-size: 13px;
-            font-weight: 500;
-            background-color: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
-    
-    def apply_date_styling(self, date_edit):
-        """Apply theme-aware styling to date edit widgets"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        if is_dark:
-            bg_color = '#2C2C2E'
-            text_color = '#FFFFFF'
-            border_color = '#48484A'
-        else:
-            bg_color = '#F8F9FA'
-            text_color = '#1C1C1E'
-            border_color = '#D1D1D6'
-        
-        date_edit.setStyleSheet(f"""
-            QDateEdit {{
-                padding: 8px 12px;
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 500;
-                color: {text_color};
-                background-color: {bg_color};
-                min-width: 120px;
-            }}
-            QDateEdit:focus {{
-                border-color: #007AFF;
-            }}
-            QDateEdit::drop-down {{
-                border: none;
-                background-color: transparent;
-            }}
-        """)
-    
     def create_button(self, text, color):
         btn = QPushButton(text)
         btn.setFixedHeight(40)
@@ -295,38 +247,72 @@ class ExportBackupWidget(QWidget):
         """)
         return btn
     
+    def run_task(self, label, fn, *args, on_success, error_text):
+        """Run fn(*args) off the GUI thread behind a modal busy dialog"""
+        progress = QProgressDialog(label, None, 0, 0, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        
+        def finished(result):
+            progress.close()
+            on_success(result)
+        
+        def failed(error):
+            progress.close()
+            QMessageBox.critical(self, "Error", f"{error_text}:\n{error}")
+        
+        task = ExportTask(fn, *args)
+        task.signals.finished.connect(finished)
+        task.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(task)
+    
+    def _get_file_dialog(self):
+        """One file dialog per widget, built on first use and reused afterwards"""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+        return self._file_dialog
+    
+    def _save_dialog(self, title, default_name, name_filter):
+        dlg = self._get_file_dialog()
+        dlg.setWindowTitle(title)
+        dlg.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dlg.setFileMode(QFileDialog.FileMode.AnyFile)
+        dlg.setNameFilter(name_filter)
+        dlg.setDirectory(str(self._home))
+        dlg.selectFile(default_name)
+        return dlg.selectedFiles()[0] if dlg.exec() else ''
+    
+    def _open_dialog(self, title, directory, name_filter):
+        dlg = self._get_file_dialog()
+        dlg.setWindowTitle(title)
+        dlg.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dlg.setNameFilter(name_filter)
+        dlg.setDirectory(str(directory))
+        dlg.selectFile('')
+        return dlg.selectedFiles()[0] if dlg.exec() else ''
+    
+    def _date_range_strings(self):
+        return (self.start_date.date().toString("yyyy-MM-dd"),
+                self.end_date.date().toString("yyyy-MM-dd"))
+    
     def export_csv(self):
-        try:
-            path, _ = QFileDialog.getSaveFileName(
-                self, "Export CSV",
-                str(Path.home() / f"puthu_export_{datetime.now().strftime('%Y%m%d')}.csv"),
-                "CSV Files (*.csv)"
+        start, end = self._date_range_strings()
+        path = self._save_dialog(
+            "Export CSV", f"puthu_export_{datetime.now().strftime('%Y%m%d')}.csv", "CSV Files (*.csv)"
+        )
+        if path:
+            self.run_task(
+                "Exporting CSV...", self.exporter.export_to_csv, path,
+                start, end,
+                on_success=lambda _: QMessageBox.information(self, "Success", f"Exported to:\n{path}"),
+                error_text="Export failed"
             )
-            if path:
-                DataExporter(self.db_manager).export_to_csv(
-                    path,
-                    self.start_date.date().toString("yyyy-MM-dd"),
-                    self.end_date.date().toString("yyyy-MM-dd")
-                )
-                QMessageBox.information(self, "Success", f"Exported to:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Export failed:\n{e}")
     
     def export_pdf(self):
         """Export to PDF - Enhanced with better error handling"""
         try:
-            # Check if reportlab is available
-            try:
-                from reportlab.lib import colors
-                from reportlab.lib.pagesizes import letter
-                from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-                from reportlab.lib.styles import getSampleStyleSheet
-                from reportlab.lib.units import inch
-                from reportlab.lib.enums import TA_CENTER
-                PDF_AVAILABLE = True
-            except ImportError:
-                PDF_AVAILABLE = False
-            
             if not PDF_AVAILABLE:
                 reply = QMessageBox.question(
                     self, "Install ReportLab?",
@@ -343,45 +329,43 @@ class ExportBackupWidget(QWidget):
                         "Then restart Puthu Tracker.")
                 return
             
-            path, _ = QFileDialog.getSaveFileName(
-                self, "Export PDF",
-                str(Path.home() / f"puthu_report_{datetime.now().strftime('%Y%m%d')}.pdf"),
-                "PDF Files (*.pdf)"
+            start, end = self._date_range_strings()
+            path = self._save_dialog(
+                "Export PDF", f"puthu_report_{datetime.now().strftime('%Y%m%d')}.pdf", "PDF Files (*.pdf)"
             )
             if path:
-                DataExporter(self.db_manager).export_to_pdf(
-                    path,
-                    self.start_date.date().toString("yyyy-MM-dd"),
-                    self.end_date.date().toString("yyyy-MM-dd")
+                self.run_task(
+                    "Creating PDF report...", self.exporter.export_to_pdf, path,
+                    start, end,
+                    on_success=lambda _: QMessageBox.information(self, "Success", f"PDF created:\n{path}"),
+                    error_text="PDF export failed"
                 )
-                QMessageBox.information(self, "Success", f"PDF created:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"PDF export failed:\n{str(e)}\n\nMake sure reportlab is installed: pip install reportlab")
     
     def export_json(self):
-        try:
-            path, _ = QFileDialog.getSaveFileName(
-                self, "Export JSON",
-                str(Path.home() / f"puthu_export_{datetime.now().strftime('%Y%m%d')}.json"),
-                "JSON Files (*.json)"
+        start, end = self._date_range_strings()
+        path = self._save_dialog(
+            "Export JSON", f"puthu_export_{datetime.now().strftime('%Y%m%d')}.json", "JSON Files (*.json)"
+        )
+        if path:
+            self.run_task(
+                "Exporting JSON...", self.exporter.export_to_json, path,
+                start, end,
+                on_success=lambda _: QMessageBox.information(self, "Success", f"Exported to:\n{path}"),
+                error_text="Export failed"
             )
-            if path:
-                DataExporter(self.db_manager).export_to_json(
-                    path,
-                    self.start_date.date().toString("yyyy-MM-dd"),
-                    self.end_date.date().toString("yyyy-MM-dd")
-                )
-                QMessageBox.information(self, "Success", f"Exported to:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Export failed:\n{e}")
     
     def create_backup(self):
-        try:
-            path = self.backup_manager.create_backup()
-            self.update_backup_info()
-            QMessageBox.information(self, "Success", f"Backup created:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Backup failed:\n{e}")
+        self.run_task(
+            "Creating backup...", self.backup_manager.create_backup,
+            on_success=self.on_backup_created,
+            error_text="Backup failed"
+        )
+    
+    def on_backup_created(self, path):
+        self.schedule_backup_info_update()
+        QMessageBox.information(self, "Success", f"Backup created:\n{path}")
     
     def view_backups(self):
         if self.backup_manager.backup_dir.exists():
@@ -390,10 +374,8 @@ class ExportBackupWidget(QWidget):
             QMessageBox.information(self, "No Backups", "No backups created yet.")
     
     def restore_backup(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select Backup",
-            str(self.backup_manager.backup_dir),
-            "Database Files (*.db)"
+        path = self._open_dialog(
+            "Select Backup", self.backup_manager.backup_dir, "Database Files (*.db *.db.zst)"
         )
         if not path:
             return
@@ -404,99 +386,141 @@ class ExportBackupWidget(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                self.backup_manager.restore_backup(path)
-                QMessageBox.information(self, "Success", 
-                                      "Restored! Restart the app.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Restore failed:\n{e}")
+            # The slow backup and copy run off the GUI thread; the swap happens back here
+            self.run_task(
+                "Restoring backup...", self.backup_manager.stage_restore, path,
+                on_success=self.on_restore_staged,
+                error_text="Restore failed"
+            )
+    
+    def on_restore_staged(self, tmp_path):
+        """Swap the staged copy in on the GUI thread, where no other database work can interleave"""
+        self.exporter.close()  # Reopened lazily against the restored file
+        self.about_to_restore.emit()  # Buffered sessions must not land in the restored data
+        try:
+            self.backup_manager.swap_in_restore(tmp_path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Restore failed:\n{e}")
+            return
+        self.schedule_backup_info_update()
+        self.backup_restored.emit()
+        QMessageBox.information(self, "Success", "Backup restored!")
+    
+    def schedule_backup_info_update(self):
+        """Refresh the backup labels once per event-loop pass, however many changes land"""
+        if self._backup_info_pending:
+            return
+        self._backup_info_pending = True
+        QTimer.singleShot(0, self.update_backup_info)
     
     def update_backup_info(self):
-        backups = self.backup_manager.list_backups()
-        if backups:
-            self.last_backup_label.setText(f"Last: {backups[0]['date_str']}")
-            self.backup_count_label.setText(f"Total: {len(backups)}")
+        self._backup_info_pending = False
+        count, last = self.backup_manager.latest_backup_and_count()
+        if count:
+            self.last_backup_label.setText(f"Last: {last}")
+            self.backup_count_label.setText(f"Total: {count}")
         else:
             self.last_backup_label.setText("Last: Never")
             self.backup_count_label.setText("Total: 0")
     
+    @classmethod
+    def theme_stylesheet(cls, is_dark):
+        """Stylesheet for every styled role in the widget, built once per theme"""
+        qss = cls._theme_qss.get(is_dark)
+        if qss is None:
+            if is_dark:
+                tc, tm, bg, border = '#FFFFFF', '#98989D', '#1C1C1E', '#38383A'
+                field_bg, field_border = '#2C2C2E', '#48484A'
+            else:
+                tc, tm, bg, border = '#1C1C1E', '#8E8E93', '#FFFFFF', '#E5E5EA'
+                field_bg, field_border = '#F8F9FA', '#D1D1D6'
+            label_roles = {
+                "page_title": f"font-size:28px;font-weight:900;color:{tc}",
+                "section_title": f"font-size:18px;font-weight:700;color:{tc}",
+                "description": f"font-size:14px;color:{tm}",
+                "field_label": f"font-size:14px;font-weight:600;color:{tc}",
+                "warning": "font-size:13px;font-weight:500;color:#FF3B30",
+            }
+            qss = (
+                f"QFrame[styleRole=\"section\"]{{background-color:{bg};border:1px solid {border};border-radius:12px}}"
+                + "".join(
+                    f"QLabel[styleRole=\"{role}\"]{{{rule};background-color:transparent;border:none;padding:0px;margin:0px}}"
+                    for role, rule in label_roles.items()
+                ) +
+                f"QDateEdit{{padding:8px 12px;border:2px solid {field_border};border-radius:8px;font-size:14px;"
+                f"font-weight:500;color:{tc};background-color:{field_bg};min-width:120px}}"
+                "QDateEdit:focus{border-color:#007AFF}"
+                "QDateEdit::drop-down{border:none;background-color:transparent}"
+            )
+            cls._theme_qss[is_dark] = qss
+        return qss
+    
     def update_theme(self):
         """Update all styling when theme changes"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
         is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        tc = '#FFFFFF' if is_dark else '#1C1C1E'
-        tm = '#98989D' if is_dark else '#8E8E93'
-        
-        # Update ALL labels by finding them
-        for label in self.findChildren(QLabel):
-            current_text = label.text()
-            
-            # Main page title
-            if "📤 Export & Backup" in current_text:
-                label.setStyleSheet(f"font-size:28px;font-weight:900;color:{tc};background-color:transparent;border:none;padding:0px;margin:0px")
-            
-            # Section titles with emojis - MORE SPECIFIC MATCHING
-            elif "📊 Export Data" in current_text or "Export Data" in current_text:
-                label.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent;border:none;padding:0px;margin:0px")
-            elif "💾 Backup Management" in current_text or "Backup Management" in current_text:
-                label.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent;border:none;padding:0px;margin:0px")
-            elif "📥 Import & Restore" in current_text or "Import & Restore" in current_text:
-                label.setStyleSheet(f"font-size:18px;font-weight:700;color:{tc};background-color:transparent;border:none;padding:0px;margin:0px")
-            
-            # Description text
-            elif "Export your tracking data" in current_text:
-                label.setStyleSheet(f"font-size:14px;color:{tm};background-color:transparent;border:none;padding:0px;margin:0px")
-            elif "Generate detailed" in current_text:
-                label.setStyleSheet(f"font-size:14px;color:{tm};background-color:transparent;border:none;padding:0px;margin:0px")
-            
-            # Labels (From:, To:, Last:, Total:)
-            elif current_text in ["From:", "To:", "Last:", "Total:"]:
-                label.setStyleSheet(f"font-size:14px;font-weight:600;color:{tc};background-color:transparent;border:none;padding:0px;margin:0px")
-            
-            # Last: Never and Total: 0 text
-            elif "Last:" in current_text or "Total:" in current_text:
-                label.setStyleSheet(f"font-size:14px;font-weight:600;color:{tc};background-color:transparent;border:none;padding:0px;margin:0px")
-            
-            # Warning label (always red)
-            elif "⚠️ Warning" in current_text or "Warning:" in current_text:
-                label.setStyleSheet("color:#FF3B30;font-size:13px;font-weight:500;background-color:transparent;border:none;padding:0px;margin:0px")
-        
-        # Update date edits
-        for date_edit in self.findChildren(QDateEdit):
-            self.apply_date_styling(date_edit)
-        
-        # Update all section frames (cards) - FORCE UPDATE ALL FRAMES
-        for section in self.findChildren(QFrame):
-            # Apply styling to all QFrame widgets that are section cards
-            if section.layout():
-                self.apply_section_styling(section)
-        
-        # Force visual update
-        self.update()
+        self.setStyleSheet(self.theme_stylesheet(is_dark))
 
 
 class DataExporter:
+    APP_ROWS_QUERY = """
+        SELECT app_name, window_title, start_time, end_time, duration, date
+        FROM app_usage WHERE date BETWEEN ? AND ? ORDER BY date, start_time
+    """
+    BROWSER_ROWS_QUERY = """
+        SELECT browser_name, tab_title, url, start_time, end_time, duration, date
+        FROM browser_usage WHERE date BETWEEN ? AND ? ORDER BY date, start_time
+    """
+    APP_JSON_KEYS = ('app', 'window', 'start', 'end', 'duration', 'date')
+    BROWSER_JSON_KEYS = ('browser', 'tab', 'url', 'start', 'end', 'duration', 'date')
+    
     def __init__(self, db_manager):
         self.db_manager = db_manager
+        self._conn = None
+    
+    @property
+    def conn(self):
+        """Shared read connection, opened on first use"""
+        if self._conn is None:
+            # journal_mode=WAL is set by DatabaseManager and persists in the file
+            self._conn = sqlite3.connect(self.db_manager.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+        return self._conn
+    
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def get_app_data(self, start_date, end_date):
+        return self.conn.execute(self.APP_ROWS_QUERY, (start_date, end_date)).fetchall()
+    
+    def get_browser_data(self, start_date, end_date):
+        return self.conn.execute(self.BROWSER_ROWS_QUERY, (start_date, end_date)).fetchall()
     
     def get_data_range(self, start_date, end_date):
-        with sqlite3.connect(self.db_manager.db_path) as conn:
+        return self.get_app_data(start_date, end_date), self.get_browser_data(start_date, end_date)
+    
+    def get_pdf_summary(self, start_date, end_date, top_n=10):
+        """Totals and top apps for a date range, aggregated in SQLite"""
+        with self.conn as conn:
             cursor = conn.cursor()
+            # One grouped scan; the per-app rows are few, so the totals fold in Python
             cursor.execute("""
-                SELECT app_name, window_title, start_time, end_time, duration, date
-                FROM app_usage WHERE date BETWEEN ? AND ? ORDER BY start_time
-            """, (start_date, end_date))
-            app_data = cursor.fetchall()
-            
-            cursor.execute("""
-                SELECT browser_name, tab_title, url, start_time, end_time, duration, date
-                FROM browser_usage WHERE date BETWEEN ? AND ? ORDER BY start_time
+                SELECT app_name, COALESCE(SUM(duration), 0) as total_duration, COUNT(*)
+                FROM app_usage WHERE date BETWEEN ? AND ?
+                GROUP BY app_name ORDER BY total_duration DESC
             """, (start_date, end_date))
-            browser_data = cursor.fetchall()
-            return app_data, browser_data
+            per_app = cursor.fetchall()
+        
+        total_time = sum(row[1] for row in per_app)
+        session_count = sum(row[2] for row in per_app)
+        top_apps = [(app, total) for app, total, _ in per_app[:top_n]]
+        return total_time, session_count, len(per_app), top_apps
     
     def export_to_csv(self, path, start_date, end_date):
-        app_data, browser_data = self.get_data_range(start_date, end_date)
+        # Rows stream straight from the cursors into the CSV writer, never held in a list
+        conn = self.conn
         with open(path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['Puthu Tracker Export'])
@@ -505,96 +529,72 @@ class DataExporter:
             
             writer.writerow(['=== APPLICATIONS ==='])
             writer.writerow(['App', 'Window', 'Start', 'End', 'Duration(s)', 'Date'])
-            for row in app_data:
-                writer.writerow(row)
+            writer.writerows(conn.execute(self.APP_ROWS_QUERY, (start_date, end_date)))
             
             writer.writerow([])
             writer.writerow(['=== BROWSER ==='])
             writer.writerow(['Browser', 'Tab', 'URL', 'Start', 'End', 'Duration(s)', 'Date'])
-            for row in browser_data:
-                writer.writerow(row)
+            writer.writerows(conn.execute(self.BROWSER_ROWS_QUERY, (start_date, end_date)))
     
     def export_to_json(self, path, start_date, end_date):
-        app_data, browser_data = self.get_data_range(start_date, end_date)
-        data = {
-            'export_info': {
-                'date_range': {'start': start_date, 'end': end_date},
-                'export_date': datetime.now().isoformat(),
-                'version': '2.0'
-            },
-            'app_usage': [
-                {'app': r[0], 'window': r[1], 'start': r[2], 'end': r[3], 
-                 'duration': r[4], 'date': r[5]} for r in app_data
-            ],
-            'browser_usage': [
-                {'browser': r[0], 'tab': r[1], 'url': r[2], 'start': r[3], 
-                 'end': r[4], 'duration': r[5], 'date': r[6]} for r in browser_data
-            ]
+        # Rows are encoded one at a time from the cursor, so no list of dicts is built
+        export_info = {
+            'date_range': {'start': start_date, 'end': end_date},
+            'export_date': datetime.now().isoformat(),
+            'version': '2.0'
         }
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        conn = self.conn
+        with open(path, 'wb') as f:
+            f.write(b'{\n  "export_info": ' + _json_dumps(export_info) + b',\n  "app_usage": [')
+            self._write_json_rows(f, self.APP_JSON_KEYS,
+                                  conn.execute(self.APP_ROWS_QUERY, (start_date, end_date)))
+            f.write(b'\n  ],\n  "browser_usage": [')
+            self._write_json_rows(f, self.BROWSER_JSON_KEYS,
+                                  conn.execute(self.BROWSER_ROWS_QUERY, (start_date, end_date)))
+            f.write(b'\n  ]\n}\n')
+    
+    @staticmethod
+    def _write_json_rows(f, keys, rows):
+        separator = b'\n    '
+        for row in rows:
+            f.write(separator + _json_dumps(dict(zip(keys, row))))
+            separator = b',\n    '
     
     def export_to_pdf(self, path, start_date, end_date):
         if not PDF_AVAILABLE:
             raise ImportError("ReportLab not installed")
         
-        app_data, browser_data = self.get_data_range(start_date, end_date)
+        total_time, session_count, app_count, top_apps = self.get_pdf_summary(start_date, end_date)
         doc = SimpleDocTemplate(path, pagesize=letter)
         story = []
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle(
-            'Title', parent=styles['Heading1'], fontSize=24,
-            textColor=colors.HexColor('#007AFF'), spaceAfter=30, alignment=TA_CENTER
-        )
+        styles = PDF_STYLES
         
-        story.append(Paragraph("Puthu Tracker Report", title_style))
+        story.append(Paragraph("Puthu Tracker Report", PDF_TITLE_STYLE))
         story.append(Paragraph(f"Period: {start_date} to {end_date}", styles['Normal']))
         story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", 
                               styles['Normal']))
         story.append(Spacer(1, 0.3*inch))
         
         # Summary
-        total_time = sum(r[4] for r in app_data)
         hrs, mins = total_time // 3600, (total_time % 3600) // 60
         
         summary = [
             ['Metric', 'Value'],
             ['Total Time', f'{hrs}h {mins}m'],
-            ['Apps Used', str(len(set(r[0] for r in app_data)))],
-            ['Sessions', str(len(app_data))]
+            ['Apps Used', str(app_count)],
+            ['Sessions', str(session_count)]
         ]
         
-        t = Table(summary, colWidths=[3*inch, 3*inch])
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#007AFF')),
-            ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('GRID', (0,0), (-1,-1), 1, colors.black)
-        ]))
+        t = Table(summary, colWidths=[3*inch, 3*inch], style=PDF_SUMMARY_TABLE_STYLE)
         
         story.append(t)
         story.append(Spacer(1, 0.3*inch))
         
         # Top Apps
-        app_totals = {}
-        for r in app_data:
-            app_totals[r[0]] = app_totals.get(r[0], 0) + r[4]
-        
-        top_apps = sorted(app_totals.items(), key=lambda x: x[1], reverse=True)[:10]
         app_table = [['Application', 'Time']]
-        for app, dur in top_apps:
-            h, m = dur // 3600, (dur % 3600) // 60
-            app_table.append([app, f'{h}h {m}m'])
-        
-        t2 = Table(app_table, colWidths=[3*inch, 2*inch])
-        t2.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#34C759')),
-            ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('GRID', (0,0), (-1,-1), 1, colors.black)
-        ]))
+        app_table += [[app, f'{dur // 3600}h {(dur % 3600) // 60}m'] for app, dur in top_apps]
+        
+        t2 = Table(app_table, colWidths=[3*inch, 2*inch], repeatRows=1, style=PDF_APPS_TABLE_STYLE)
         
         story.append(Paragraph("Top Applications", styles['Heading2']))
         story.append(t2)
@@ -603,6 +603,8 @@ class DataExporter:
 
 
 class BackupManager:
+    BACKUP_SUFFIXES = ('.db', '.db.zst')  # Plain and zstd-compressed backups
+    
     def __init__(self, db_manager):
         self.db_manager = db_manager
         self.backup_dir = Path(__file__).parent / 'backups'
@@ -625,32 +627,98 @@ class BackupManager:
     def create_backup(self):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = self.backup_dir / f'backup_{timestamp}.db'
-        shutil.copy2(self.db_manager.db_path, backup_path)
+        # Online backup API copies pages through SQLite, so writes in flight stay consistent
+        src = sqlite3.connect(self.db_manager.db_path)
+        dst = sqlite3.connect(str(backup_path))
+        try:
+            with dst:
+                src.backup(dst)
+        finally:
+            src.close()
+            dst.close()
+        
+        if zstd is not None:
+            compressed_path = backup_path.with_name(backup_path.name + '.zst')
+            with open(backup_path, 'rb') as raw, open(compressed_path, 'wb') as out:
+                zstd.ZstdCompressor(level=3, threads=-1).copy_stream(raw, out)
+            backup_path.unlink()
+            backup_path = compressed_path
+        
         self.cleanup_old_backups()
         return backup_path
     
     def restore_backup(self, backup_path):
-        self.create_backup()  # Backup current before restoring
-        shutil.copy2(backup_path, self.db_manager.db_path)
+        """Stage and swap in a backup; call where no other thread is using the database"""
+        self.swap_in_restore(self.stage_restore(backup_path))
     
-    def list_backups(self):
+    def stage_restore(self, backup_path):
+        """Back up the current data and copy the backup beside the database; returns the copy's path"""
+        self.create_backup()  # Backup current before restoring
+        # Stage the copy beside the database and swap it in, so a crash never leaves it half-written
+        db_path = str(self.db_manager.db_path)
+        tmp_path = db_path + '.restore.tmp'
+        if str(backup_path).endswith('.zst'):
+            if zstd is None:
+                raise ImportError("Compressed backups need zstandard: pip install zstandard")
+            with open(backup_path, 'rb') as packed, open(tmp_path, 'wb') as out:
+                zstd.ZstdDecompressor().copy_stream(packed, out)
+        else:
+            shutil.copy2(backup_path, tmp_path)
+        return tmp_path
+    
+    def swap_in_restore(self, tmp_path):
+        """Close every database connection, then replace the database with the staged copy"""
+        # Open connections would keep using the old file (and its -wal/-shm) after the swap
+        self.db_manager.close_all()
+        db_path = str(self.db_manager.db_path)
+        for sidecar in (db_path + '-wal', db_path + '-shm'):
+            # WAL pages of the old database must not be replayed onto the restored one
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+        os.replace(tmp_path, db_path)
+        # Bring an older backup's schema (domain column, indexes) up to date
+        self.db_manager.init_database()
+    
+    def scan_backups(self):
+        """(mtime_ns, name, path) for every backup file, newest first"""
+        with os.scandir(self.backup_dir) as it:
+            entries = [(e.stat().st_mtime_ns, e.name, e.path) for e in it
+                       if e.name.startswith('backup_') and e.name.endswith(self.BACKUP_SUFFIXES)]
+        entries.sort(reverse=True)
+        return entries
+    
+    def latest_backup_and_count(self):
+        """(count, formatted newest mtime) in one scandir pass without sorting"""
+        count, newest = 0, None
+        with os.scandir(self.backup_dir) as it:
+            for e in it:
+                if e.name.startswith('backup_') and e.name.endswith(self.BACKUP_SUFFIXES):
+                    count += 1
+                    mtime = e.stat().st_mtime_ns
+                    if newest is None or mtime > newest:
+                        newest = mtime
+        if newest is None:
+            return 0, None
+        return count, datetime.fromtimestamp(newest / 1e9).strftime('%Y-%m-%d %H:%M')
+    
+    def list_backups(self, limit=None):
+        """Newest-first backup details; only the first `limit` entries are formatted"""
         backups = []
-        for f in self.backup_dir.glob('backup_*.db'):
-            stat = f.stat()
+        for mtime_ns, name, path in self.scan_backups()[:limit]:
+            date = datetime.fromtimestamp(mtime_ns / 1e9)
             backups.append({
-                'path': f,
-                'name': f.name,
-                'date': datetime.fromtimestamp(stat.st_mtime),
-                'date_str': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
+                'path': Path(path),
+                'name': name,
+                'mtime_ns': mtime_ns,
+                'date': date,
+                'date_str': date.strftime('%Y-%m-%d %H:%M')
             })
-        return sorted(backups, key=lambda x: x['date'], reverse=True)
+        return backups
     
     def cleanup_old_backups(self):
-        backups = self.list_backups()
         max_backups = self.settings.get('max_backups', 10)
-        if len(backups) > max_backups:
-            for backup in backups[max_backups:]:
-                backup['path'].unlink()
+        for _, _, path in self.scan_backups()[max_backups:]:
+            os.unlink(path)
 
 
 class AutoBackupSettingsDialog(QDialog):
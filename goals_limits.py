@@ -10,23 +10,403 @@ Features:
 
 import json
 import os
+import time
+from collections import namedtuple
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 
+try:
+    import orjson  # Optional fast JSON codec
+except ImportError:
+    orjson = None
+
+# Stylesheets are fixed per theme, so each variant is a single shared string
+_TITLE_LIGHT = """
+    font-size: 28px;
+    font-weight: 700;
+    color: #000000;
+    background-color: transparent;
+    margin-bottom: 10px;
+"""
+_TITLE_DARK = """
+    font-size: 28px;
+    font-weight: 700;
+    color: #FFFFFF;
+    background-color: transparent;
+    margin-bottom: 10px;
+"""
+_SCROLL_LIGHT = """
+    QScrollArea {
+        background-color: transparent;
+        border: none;
+    }
+    QScrollBar:vertical {
+        background-color: #F0F2F5;
+        width: 12px;
+        border-radius: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #D1D1D6;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: #007AFF;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+"""
+_SCROLL_DARK = """
+    QScrollArea {
+        background-color: transparent;
+        border: none;
+    }
+    QScrollBar:vertical {
+        background-color: #1C1C1E;
+        width: 12px;
+        border-radius: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #48484A;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: #007AFF;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+"""
+_CARD_LIGHT = """
+    QFrame {
+        background-color: #FFFFFF;
+        border: none;
+        border-radius: 12px;
+    }
+"""
+_CARD_DARK = """
+    QFrame {
+        background-color: #1C1C1E;
+        border: none;
+        border-radius: 12px;
+    }
+"""
+# Card frame plus the rows inside it, so the rows need no sheets of their own
+_PROGRESS_CARD_LIGHT = _CARD_LIGHT + """
+    QLabel#progressName {
+        font-weight: 600;
+        color: #1C1C1E;
+        background-color: transparent;
+    }
+    QLabel#progressTime {
+        color: #8E8E93;
+        background-color: transparent;
+    }
+    QProgressBar {
+        border: 2px solid #E5E5EA;
+        border-radius: 8px;
+        text-align: center;
+        font-weight: 600;
+        background-color: #F2F2F7;
+        color: #1C1C1E;
+    }
+    QProgressBar::chunk {
+        border-radius: 6px;
+    }
+    QProgressBar[severity="red"]::chunk { background-color: #FF3B30; }
+    QProgressBar[severity="orange"]::chunk { background-color: #FF9500; }
+    QProgressBar[severity="green"]::chunk { background-color: #34C759; }
+"""
+_PROGRESS_CARD_DARK = _CARD_DARK + """
+    QLabel#progressName {
+        font-weight: 600;
+        color: #FFFFFF;
+        background-color: transparent;
+    }
+    QLabel#progressTime {
+        color: #98989D;
+        background-color: transparent;
+    }
+    QProgressBar {
+        border: 2px solid #48484A;
+        border-radius: 8px;
+        text-align: center;
+        font-weight: 600;
+        background-color: #2C2C2E;
+        color: #FFFFFF;
+    }
+    QProgressBar::chunk {
+        border-radius: 6px;
+    }
+    QProgressBar[severity="red"]::chunk { background-color: #FF3B30; }
+    QProgressBar[severity="orange"]::chunk { background-color: #FF9500; }
+    QProgressBar[severity="green"]::chunk { background-color: #34C759; }
+"""
+_HEADER_LIGHT = """
+    font-size: 18px;
+    font-weight: 700;
+    color: #1C1C1E;
+    background-color: transparent;
+"""
+_HEADER_DARK = """
+    font-size: 18px;
+    font-weight: 700;
+    color: #FFFFFF;
+    background-color: transparent;
+"""
+_DESCRIPTION_LIGHT = """
+    color: #8E8E93;
+    font-size: 13px;
+    background-color: transparent;
+"""
+_DESCRIPTION_DARK = """
+    color: #98989D;
+    font-size: 13px;
+    background-color: transparent;
+"""
+_TOGGLE_STYLE = """
+    QCheckBox::indicator {
+        width: 50px;
+        height: 28px;
+        border-radius: 14px;
+        background-color: #E5E5EA;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #34C759;
+    }
+"""
+_SPINBOX_LIGHT = """
+    QDoubleSpinBox {
+        background-color: #F8F9FA;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 15px;
+        font-weight: 600;
+        color: #1C1C1E;
+    }
+    QDoubleSpinBox:focus {
+        border: 2px solid #007AFF;
+    }
+"""
+_SPINBOX_DARK = """
+    QDoubleSpinBox {
+        background-color: #2C2C2E;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 15px;
+        font-weight: 600;
+        color: white;
+    }
+    QDoubleSpinBox:focus {
+        border: 2px solid #007AFF;
+    }
+"""
+_PRIMARY_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #007AFF;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: 600;
+        font-size: 15px;
+    }
+    QPushButton:hover {
+        background-color: #0056CC;
+    }
+    QPushButton:pressed {
+        background-color: #004499;
+    }
+"""
+_SUCCESS_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #34C759;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: 600;
+        font-size: 15px;
+    }
+    QPushButton:hover {
+        background-color: #28A745;
+    }
+    QPushButton:pressed {
+        background-color: #208B3A;
+    }
+"""
+_SECONDARY_BUTTON_LIGHT = """
+    QPushButton {
+        background-color: #F2F2F7;
+        color: #007AFF;
+        border: none;
+        border-radius: 8px;
+        padding: 6px 12px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #E5E5EA;
+    }
+    QPushButton:pressed {
+        background-color: #D1D1D6;
+    }
+"""
+_SECONDARY_BUTTON_DARK = """
+    QPushButton {
+        background-color: #2C2C2E;
+        color: #007AFF;
+        border: none;
+        border-radius: 8px;
+        padding: 6px 12px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #3A3A3C;
+    }
+    QPushButton:pressed {
+        background-color: #48484A;
+    }
+"""
+_COMBOBOX_LIGHT = """
+    QComboBox {
+        background-color: #F8F9FA;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 15px;
+        color: #1C1C1E;
+    }
+    QComboBox:focus {
+        border: 2px solid #007AFF;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+    }
+    QComboBox::down-arrow {
+        width: 0;
+        height: 0;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 6px solid #8E8E93;
+    }
+    QComboBox QAbstractItemView {
+        background-color: white;
+        color: #1C1C1E;
+        border: 1px solid #E5E5EA;
+        border-radius: 8px;
+        selection-background-color: #007AFF;
+        outline: none;
+    }
+"""
+_COMBOBOX_DARK = """
+    QComboBox {
+        background-color: #2C2C2E;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 15px;
+        color: white;
+    }
+    QComboBox:focus {
+        border: 2px solid #007AFF;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+    }
+    QComboBox::down-arrow {
+        width: 0;
+        height: 0;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 6px solid #8E8E93;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #2C2C2E;
+        color: white;
+        border: 1px solid #48484A;
+        border-radius: 8px;
+        selection-background-color: #007AFF;
+        outline: none;
+    }
+"""
+_SECTION_LABEL_LIGHT = """
+    font-size: 14px;
+    font-weight: 600;
+    color: #1C1C1E;
+    margin-top: 10px;
+    background-color: transparent;
+"""
+_SECTION_LABEL_DARK = """
+    font-size: 14px;
+    font-weight: 600;
+    color: #FFFFFF;
+    margin-top: 10px;
+    background-color: transparent;
+"""
+_LIST_LIGHT = """
+    QListView {
+        background-color: transparent;
+        border: none;
+        border-radius: 8px;
+        padding: 0;
+    }
+"""
+_LIST_DARK = """
+    QListView {
+        background-color: #2C2C2E;
+        border: none;
+        border-radius: 8px;
+        padding: 8px;
+    }
+"""
+
+# One goal/limit warning from check_limits; app is None for the daily goal
+LimitWarning = namedtuple('LimitWarning', ['type', 'message', 'severity', 'progress', 'app'], defaults=(None,))
+
 class GoalsManager:
     """Manages user goals and limits"""
+    __slots__ = ('goals_file', 'goals', 'notifications_sent', '_goals_version', '_check_cache',
+                 '_limit_text', '_dirty', '_save_timer', '__weakref__')  # Qt slot connections hold weak refs
     
     def __init__(self):
         self.goals_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'goals_settings.json')
         self.goals = self.load_goals()
-        self.notifications_sent = set()  # Track sent notifications
+        self.notifications_sent = {}  # {warning_id: hour it was last notified}
+        self._goals_version = 0  # Bumped on every goals change
+        self._check_cache = None  # (key, warnings) of the last check_limits call
+        self._limit_text = {}  # {limit_seconds: formatted limit}
+        
+        # Bursts of edits collapse into one write shortly after the last one
+        self._dirty = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.flush)
     
     def load_goals(self):
         """Load goals from JSON file"""
         if os.path.exists(self.goals_file):
             try:
+                if orjson is not None:
+                    with open(self.goals_file, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(self.goals_file, 'r') as f:
                     return json.load(f)
             except:
@@ -49,112 +429,268 @@ class GoalsManager:
     
     def save_goals(self):
         """Save goals to JSON file"""
+        self._goals_version += 1  # Every goals edit ends here, so cached checks go stale
+        self._dirty = False
         try:
-            with open(self.goals_file, 'w') as f:
-                json.dump(self.goals, f, indent=2)
+            if orjson is not None:
+                with open(self.goals_file, 'wb') as f:
+                    f.write(orjson.dumps(self.goals, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.goals_file, 'w') as f:
+                    json.dump(self.goals, f, indent=2)
             return True
         except Exception as e:
             print(f"Error saving goals: {e}")
             return False
     
+    def mark_dirty(self):
+        """Schedule a debounced save after a goals change"""
+        self._goals_version += 1
+        self._dirty = True
+        self._save_timer.start(500)
+    
+    def flush(self):
+        """Write pending goal changes now"""
+        if self._dirty:
+            self._save_timer.stop()
+            self.save_goals()
+    
     def set_daily_screen_time_goal(self, hours):
         """Set daily screen time goal in hours"""
-        self.goals['daily_screen_time_goal'] = int(hours * 3600)
-        self.save_goals()
+        seconds = int(hours * 3600)
+        if self.goals['daily_screen_time_goal'] == seconds:
+            return  # Unchanged, nothing to write
+        self.goals['daily_screen_time_goal'] = seconds
+        self.mark_dirty()
     
     def set_app_limit(self, app_name, hours):
         """Set time limit for specific app"""
-        self.goals['app_limits'][app_name] = int(hours * 3600)
-        self.save_goals()
+        seconds = int(hours * 3600)
+        if self.goals['app_limits'].get(app_name) == seconds:
+            return  # Unchanged, nothing to write
+        self.goals['app_limits'][app_name] = seconds
+        self.mark_dirty()
     
     def remove_app_limit(self, app_name):
         """Remove time limit for specific app"""
         if app_name in self.goals['app_limits']:
             del self.goals['app_limits'][app_name]
-            self.save_goals()
+            self.mark_dirty()
     
-    def check_limits(self, db_manager, date=None):
+    def check_limits(self, db_manager, date=None, now=None):
         """Check if any limits are being approached or exceeded"""
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
-        
+            date = (now or datetime.now()).strftime('%Y-%m-%d')
+        
+        # Usage only changes when the tracker writes; without a counter, fall back to a 5s TTL
+        usage_version = getattr(db_manager, 'usage_version', None)
+        if usage_version is None:
+            usage_version = int(time.monotonic() // 5)
+        key = (date, self._goals_version, usage_version)
+        if self._check_cache is not None and self._check_cache[0] == key:
+            return self._check_cache[1]
+        
+        warnings = self._compute_warnings(db_manager, date)
+        self._check_cache = (key, warnings)
+        return warnings
+    
+    def _compute_warnings(self, db_manager, date):
+        """Build the warning list for check_limits"""
+        goals = self.goals
         warnings = []
+        if not (goals['daily_screen_time_enabled'] or goals['app_limits_enabled']):
+            return warnings
+        
+        # Bind the lookups the per-app loop would otherwise repeat on every row
+        threshold = goals['notification_threshold']
+        fmt_time = self._format_time
+        fmt_limit = self._format_limit
+        warn = warnings.append
+        
+        # One query feeds both the daily total and the per-app checks
+        app_data = db_manager.get_app_usage_by_date(date)
         
         # Check daily screen time
-        if self.goals['daily_screen_time_enabled']:
-            app_data = db_manager.get_app_usage_by_date(date)
+        if goals['daily_screen_time_enabled']:
             total_time = sum(duration for _, duration in app_data)
-            limit = self.goals['daily_screen_time_goal']
+            limit = goals['daily_screen_time_goal']
             
             progress = total_time / limit if limit > 0 else 0
             
             if progress >= 1.0:
-                warnings.append({
-                    'type': 'daily_limit_exceeded',
-                    'message': f'Daily screen time limit exceeded! ({self._format_time(total_time)} / {self._format_time(limit)})',
-                    'severity': 'critical',
-                    'progress': progress
-                })
-            elif progress >= self.goals['notification_threshold']:
-                warnings.append({
-                    'type': 'daily_limit_warning',
-                    'message': f'Approaching daily screen time limit ({int(progress*100)}% used)',
-                    'severity': 'warning',
-                    'progress': progress
-                })
+                warn(LimitWarning(
+                    'daily_limit_exceeded',
+                    f'Daily screen time limit exceeded! ({fmt_time(total_time)} / {fmt_limit(limit)})',
+                    'critical',
+                    progress
+                ))
+            elif progress >= threshold:
+                warn(LimitWarning(
+                    'daily_limit_warning',
+                    f'Approaching daily screen time limit ({int(progress*100)}% used)',
+                    'warning',
+                    progress
+                ))
         
         # Check app-specific limits
-        if self.goals['app_limits_enabled']:
-            app_data = db_manager.get_app_usage_by_date(date)
-            for app_name, duration in app_data:
-                if app_name in self.goals['app_limits']:
-                    limit = self.goals['app_limits'][app_name]
-                    progress = duration / limit if limit > 0 else 0
-                    
-                    if progress >= 1.0:
-                        warnings.append({
-                            'type': 'app_limit_exceeded',
-                            'app': app_name,
-                            'message': f'{app_name}: Time limit exceeded! ({self._format_time(duration)} / {self._format_time(limit)})',
-                            'severity': 'critical',
-                            'progress': progress
-                        })
-                    elif progress >= self.goals['notification_threshold']:
-                        warnings.append({
-                            'type': 'app_limit_warning',
-                            'app': app_name,
-                            'message': f'{app_name}: Approaching time limit ({int(progress*100)}% used)',
-                            'severity': 'warning',
-                            'progress': progress
-                        })
+        if goals['app_limits_enabled']:
+            limits = goals['app_limits']
+            # Only apps with a positive limit can warn; filter them in one comprehension
+            candidates = [(app_name, duration, limits[app_name], duration / limits[app_name])
+                          for app_name, duration in app_data if limits.get(app_name, 0) > 0]
+            for app_name, duration, limit, progress in candidates:
+                if progress >= 1.0:
+                    warn(LimitWarning(
+                        'app_limit_exceeded',
+                        f'{app_name}: Time limit exceeded! ({fmt_time(duration)} / {fmt_limit(limit)})',
+                        'critical',
+                        progress,
+                        app_name
+                    ))
+                elif progress >= threshold:
+                    warn(LimitWarning(
+                        'app_limit_warning',
+                        f'{app_name}: Approaching time limit ({int(progress*100)}% used)',
+                        'warning',
+                        progress,
+                        app_name
+                    ))
         
         return warnings
     
     def _format_time(self, seconds):
         """Format seconds to readable time"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
+        hours, rest = divmod(seconds, 3600)
+        minutes = rest // 60
         if hours > 0:
             return f"{hours}h {minutes}m"
         return f"{minutes}m"
     
-    def should_notify(self, warning_id):
+    def _format_limit(self, seconds):
+        """Format a goal limit; limits rarely change, so each string is built once"""
+        text = self._limit_text.get(seconds)
+        if text is None:
+            text = self._limit_text[seconds] = self._format_time(seconds)
+        return text
+    
+    def should_notify(self, warning_id, now=None):
         """Check if notification should be sent (avoid spam)"""
-        current_hour = datetime.now().strftime('%Y-%m-%d-%H')
-        notification_key = f"{warning_id}_{current_hour}"
+        current_hour = (now or datetime.now()).strftime('%Y-%m-%d-%H')
         
-        if notification_key in self.notifications_sent:
+        # One entry per warning, so the map stays bounded by the number of limits
+        if self.notifications_sent.get(warning_id) == current_hour:
             return False
         
-        self.notifications_sent.add(notification_key)
+        self.notifications_sent[warning_id] = current_hour
         return True
     
     def reset_notifications(self):
         """Reset notification tracking (call daily)"""
         self.notifications_sent.clear()
 
+# Widgets of one progress row in the Today's Progress card
+ProgressRow = namedtuple('ProgressRow', ['name_label', 'time_label', 'bar'])
+
+class AppLimitsModel(QAbstractListModel):
+    """App limits as (app_name, display text) rows for the limits list view"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def set_limits(self, app_limits):
+        """Replace all rows from the goals' {app_name: seconds} mapping"""
+        self.beginResetModel()
+        # Format each row's text once here rather than on every paint
+        self._rows = [(app_name, f"{app_name}: {seconds / 3600:.1f} hours/day")
+                      for app_name, seconds in app_limits.items()]
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        app_name, text = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == Qt.ItemDataRole.UserRole:
+            return app_name
+        return None
+
+
+class AppLimitDelegate(QStyledItemDelegate):
+    """Paints a limit row and its Remove pill directly, with no per-row widgets"""
+    remove_requested = pyqtSignal(str)
+    ROW_HEIGHT = 57
+    PILL_WIDTH = 85
+    PILL_HEIGHT = 36
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pill_brush = QBrush(QColor('#FF3B30'))
+        self._pill_text = QColor('#FFFFFF')
+        self.set_dark(False)
+    
+    def set_dark(self, is_dark):
+        """Swap the cached row colors for a theme"""
+        self._text_color = QColor('#FFFFFF' if is_dark else '#1C1C1E')
+        self._row_brush = QBrush(QColor('#2C2C2E' if is_dark else '#F8F9FA'))
+        self._hover_brush = QBrush(QColor('#3A3A3C' if is_dark else '#E5E5EA'))
+    
+    def _pill_rect(self, rect):
+        return QRect(rect.right() - 10 - self.PILL_WIDTH, rect.center().y() - self.PILL_HEIGHT // 2,
+                     self.PILL_WIDTH, self.PILL_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Row background
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._hover_brush if hovered else self._row_brush)
+        painter.drawRoundedRect(QRectF(option.rect.adjusted(0, 2, 0, -2)), 6, 6)
+        
+        # Limit text
+        font = QFont(option.font)
+        font.setPixelSize(14)
+        font.setWeight(QFont.Weight.Medium)
+        painter.setFont(font)
+        painter.setPen(self._text_color)
+        text_rect = option.rect.adjusted(18, 0, -(self.PILL_WIDTH + 30), 0)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, index.data())
+        
+        # Remove pill
+        pill = self._pill_rect(option.rect)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._pill_brush)
+        painter.drawRoundedRect(QRectF(pill), 8, 8)
+        font.setPixelSize(13)
+        font.setWeight(QFont.Weight.DemiBold)
+        painter.setFont(font)
+        painter.setPen(self._pill_text)
+        painter.drawText(pill, Qt.AlignmentFlag.AlignCenter, "Remove")
+        
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        return QSize(-1, self.ROW_HEIGHT)
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._pill_rect(option.rect).contains(event.position().toPoint())):
+            self.remove_requested.emit(index.data(Qt.ItemDataRole.UserRole))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class GoalsWidget(QWidget):
     """Widget for Goals and Limits settings"""
+    APPS_CACHE_TTL = 30.0  # Seconds before the app list is re-read
+    PROGRESS_POOL_MAX = 16  # Hidden progress rows kept for reuse
     
     def __init__(self, db_manager, goals_manager, theme_manager=None, notifier=None):
         super().__init__()
@@ -162,6 +698,35 @@ class GoalsWidget(QWidget):
         self.goals_manager = goals_manager
         self.theme_manager = theme_manager
         self.notifier = notifier  # Store notifier reference
+        self._apps_cache = None  # Sorted tracked app names
+        self._progress_pool = []  # Hidden ProgressRows ready for reuse
+        self._progress_rows = {}  # Shown rows: app name (or '__daily__') -> (index, ProgressRow)
+        self._apps_cache_ts = 0.0
+        # Coalesces bursts of limit/progress refreshes into one pass
+        self._pending_updates = set()
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._run_pending_updates)
+        # Widgets created by build_cards; None until the tab is first shown
+        self.daily_goal_card = None
+        self.daily_goal_header = None
+        self.daily_goal_spinbox = None
+        self.app_limits_card = None
+        self.app_limits_header = None
+        self.app_combo = None
+        self.app_limit_spinbox = None
+        self.limits_label = None
+        self.limits_list_widget = None
+        self.progress_card = None
+        self.progress_header = None
+        # The toggles are not shown (always enabled), so enable both now rather than
+        # when the cards are built; check_limits reads them from app start
+        goals = self.goals_manager.goals
+        if not (goals['daily_screen_time_enabled'] and goals['app_limits_enabled']):
+            goals['daily_screen_time_enabled'] = True
+            goals['app_limits_enabled'] = True
+            self.goals_manager.mark_dirty()
         self.init_ui()
         print(f"GoalsWidget initialized with notifier: {self.notifier is not None}")
     
@@ -180,6 +745,7 @@ class GoalsWidget(QWidget):
         
         # Apply scroll area styling
         self.apply_scroll_styling(scroll)
+        self.scroll_area = scroll
         
         # Create content widget for scroll area
         content_widget = QWidget()
@@ -193,6 +759,32 @@ class GoalsWidget(QWidget):
         self.apply_title_styling()
         layout.addWidget(self.title_label)
         
+        # Cards (and their DB queries) are built the first time the tab is shown
+        self.content_layout = layout
+        self._built = False
+        
+        # Set content widget to scroll area
+        scroll.setWidget(content_widget)
+        
+        # Add scroll area to main layout
+        main_layout.addWidget(scroll)
+        
+        self.setLayout(main_layout)
+    
+    def showEvent(self, event):
+        if not self._built:
+            self.build_cards()
+        else:
+            self.populate_app_combo()  # Pick up newly tracked apps
+            if self._pending_updates:
+                self._run_pending_updates()  # Refreshes deferred while hidden
+        super().showEvent(event)
+    
+    def build_cards(self):
+        """Create the goal, limit and progress cards"""
+        self._built = True
+        layout = self.content_layout
+        
         # Daily screen time goal section
         self.daily_goal_card = self.create_daily_goal_card()
         layout.addWidget(self.daily_goal_card)
@@ -206,384 +798,65 @@ class GoalsWidget(QWidget):
         layout.addWidget(self.progress_card)
         
         layout.addStretch()
-        
-        # Set content widget to scroll area
-        scroll.setWidget(content_widget)
-        
-        # Add scroll area to main layout
-        main_layout.addWidget(scroll)
-        
-        self.setLayout(main_layout)
+    
+    def _is_dark(self):
+        return self.theme_manager.dark_mode if self.theme_manager else False
     
     def apply_title_styling(self):
         """Apply theme-aware title styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        text_color = theme.get('text_primary', '#1C1C1E')
-        
-        self.title_label.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: 700;
-            color: {text_color};
-            background-color: transparent;
-            margin-bottom: 10px;
-        """)
+        self.title_label.setStyleSheet(_TITLE_DARK if self._is_dark() else _TITLE_LIGHT)
     
     def apply_scroll_styling(self, scroll):
         """Apply scroll area styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        if is_dark:
-            scroll.setStyleSheet("""
-                QScrollArea {
-                    background-color: transparent;
-                    border: none;
-                }
-                QScrollBar:vertical {
-                    background-color: #1C1C1E;
-                    width: 12px;
-                    border-radius: 6px;
-                    margin: 0px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #48484A;
-                    border-radius: 6px;
-                    min-height: 30px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background-color: #007AFF;
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    height: 0px;
-                }
-                QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                    background: none;
-                }
-            """)
-        else:
-            scroll.setStyleSheet("""
-                QScrollArea {
-                    background-color: transparent;
-                    border: none;
-                }
-                QScrollBar:vertical {
-                    background-color: #F0F2F5;
-                    width: 12px;
-                    border-radius: 6px;
-                    margin: 0px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #D1D1D6;
-                    border-radius: 6px;
-                    min-height: 30px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background-color: #007AFF;
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    height: 0px;
-                }
-                QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                    background: none;
-                }
-            """)
+        scroll.setStyleSheet(_SCROLL_DARK if self._is_dark() else _SCROLL_LIGHT)
     
     def apply_card_styling(self, card):
         """Apply theme-aware card styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        # Use proper dark theme background
-        bg_color = '#1C1C1E' if is_dark else '#FFFFFF'
-        
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg_color};
-                border: none;
-                border-radius: 12px;
-            }}
-        """)
+        card.setStyleSheet(_CARD_DARK if self._is_dark() else _CARD_LIGHT)
+    
+    def apply_progress_card_styling(self, card):
+        """Apply card styling plus the shared rules for every progress row inside it"""
+        card.setStyleSheet(_PROGRESS_CARD_DARK if self._is_dark() else _PROGRESS_CARD_LIGHT)
     
     def apply_header_label_styling(self, label):
         """Apply header label styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        text_color = '#FFFFFF' if is_dark else '#1C1C1E'
-        label.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 700;
-            color: {text_color};
-            background-color: transparent;
-        """)
+        label.setStyleSheet(_HEADER_DARK if self._is_dark() else _HEADER_LIGHT)
     
     def apply_description_styling(self, label):
         """Apply description label styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        text_color = theme.get('text_muted', '#8E8E93')
-        label.setStyleSheet(f"""
-            color: {text_color};
-            font-size: 13px;
-            background-color: transparent;
-        """)
+        label.setStyleSheet(_DESCRIPTION_DARK if self._is_dark() else _DESCRIPTION_LIGHT)
     
     def apply_toggle_styling(self, toggle):
         """Apply toggle switch styling"""
-        toggle.setStyleSheet("""
-            QCheckBox::indicator {
-                width: 50px;
-                height: 28px;
-                border-radius: 14px;
-                background-color: #E5E5EA;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #34C759;
-            }
-        """)
+        toggle.setStyleSheet(_TOGGLE_STYLE)
     
     def apply_spinbox_styling(self, spinbox):
         """Apply spinbox styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        if is_dark:
-            spinbox.setStyleSheet("""
-                QDoubleSpinBox {
-                    background-color: #2C2C2E;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font-size: 15px;
-                    font-weight: 600;
-                    color: white;
-                }
-                QDoubleSpinBox:focus {
-                    border: 2px solid #007AFF;
-                }
-            """)
-        else:
-            spinbox.setStyleSheet("""
-                QDoubleSpinBox {
-                    background-color: #F8F9FA;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font-size: 15px;
-                    font-weight: 600;
-                    color: #1C1C1E;
-                }
-                QDoubleSpinBox:focus {
-                    border: 2px solid #007AFF;
-                }
-            """)
+        spinbox.setStyleSheet(_SPINBOX_DARK if self._is_dark() else _SPINBOX_LIGHT)
     
     def apply_primary_button_styling(self, button):
         """Apply primary button styling"""
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: 600;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: #0056CC;
-            }
-            QPushButton:pressed {
-                background-color: #004499;
-            }
-        """)
+        button.setStyleSheet(_PRIMARY_BUTTON_STYLE)
     
     def apply_success_button_styling(self, button):
         """Apply success/green button styling"""
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #34C759;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: 600;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: #28A745;
-            }
-            QPushButton:pressed {
-                background-color: #208B3A;
-            }
-        """)
+        button.setStyleSheet(_SUCCESS_BUTTON_STYLE)
     
     def apply_secondary_button_styling(self, button):
         """Apply secondary button styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        if is_dark:
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2C2C2E;
-                    color: #007AFF;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 6px 12px;
-                    font-weight: 600;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #3A3A3C;
-                }
-                QPushButton:pressed {
-                    background-color: #48484A;
-                }
-            """)
-        else:
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #F2F2F7;
-                    color: #007AFF;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 6px 12px;
-                    font-weight: 600;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #E5E5EA;
-                }
-                QPushButton:pressed {
-                    background-color: #D1D1D6;
-                }
-            """)
+        button.setStyleSheet(_SECONDARY_BUTTON_DARK if self._is_dark() else _SECONDARY_BUTTON_LIGHT)
     
     def apply_combobox_styling(self, combobox):
         """Apply combobox styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        if is_dark:
-            combobox.setStyleSheet("""
-                QComboBox {
-                    background-color: #2C2C2E;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font-size: 15px;
-                    color: white;
-                }
-                QComboBox:focus {
-                    border: 2px solid #007AFF;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 30px;
-                }
-                QComboBox::down-arrow {
-                    width: 0;
-                    height: 0;
-                    border-left: 5px solid transparent;
-                    border-right: 5px solid transparent;
-                    border-top: 6px solid #8E8E93;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2C2C2E;
-                    color: white;
-                    border: 1px solid #48484A;
-                    border-radius: 8px;
-                    selection-background-color: #007AFF;
-                    outline: none;
-                }
-            """)
-        else:
-            combobox.setStyleSheet("""
-                QComboBox {
-                    background-color: #F8F9FA;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font-size: 15px;
-                    color: #1C1C1E;
-                }
-                QComboBox:focus {
-                    border: 2px solid #007AFF;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 30px;
-                }
-                QComboBox::down-arrow {
-                    width: 0;
-                    height: 0;
-                    border-left: 5px solid transparent;
-                    border-right: 5px solid transparent;
-                    border-top: 6px solid #8E8E93;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: white;
-                    color: #1C1C1E;
-                    border: 1px solid #E5E5EA;
-                    border-radius: 8px;
-                    selection-background-color: #007AFF;
-                    outline: none;
-                }
-            """)
+        combobox.setStyleSheet(_COMBOBOX_DARK if self._is_dark() else _COMBOBOX_LIGHT)
     
     def apply_section_label_styling(self, label):
         """Apply section label styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        text_color = '#FFFFFF' if is_dark else '#1C1C1E'
-        label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {text_color};
-            margin-top: 10px;
-            background-color: transparent;
-        """)
+        label.setStyleSheet(_SECTION_LABEL_DARK if self._is_dark() else _SECTION_LABEL_LIGHT)
     
     def apply_list_styling(self, list_widget):
         """Apply list widget styling"""
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        
-        if is_dark:
-            list_widget.setStyleSheet("""
-                QListWidget {
-                    background-color: #2C2C2E;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px;
-                }
-                QListWidget::item {
-                    padding: 8px;
-                    border-radius: 6px;
-                    margin: 2px 0;
-                }
-                QListWidget::item:hover {
-                    background-color: #3A3A3C;
-                }
-            """)
-        else:
-            list_widget.setStyleSheet("""
-                QListWidget {
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 0;
-                }
-                QListWidget::item {
-                    padding: 8px;
-                    border-radius: 6px;
-                    margin: 2px 0;
-                    background-color: #F8F9FA;
-                }
-                QListWidget::item:hover {
-                    background-color: #E5E5EA;
-                }
-            """)
+        list_widget.setStyleSheet(_LIST_DARK if self._is_dark() else _LIST_LIGHT)
     
     def create_daily_goal_card(self):
         """Create daily screen time goal card"""
@@ -600,10 +873,6 @@ class GoalsWidget(QWidget):
         self.apply_header_label_styling(self.daily_goal_header)
         layout.addWidget(self.daily_goal_header)
         
-        # Store toggle state but don't show it (always enabled)
-        self.goals_manager.goals['daily_screen_time_enabled'] = True
-        self.goals_manager.save_goals()
-        
         # Input section with better alignment
         input_layout = QHBoxLayout()
         input_layout.setSpacing(12)
@@ -648,10 +917,6 @@ class GoalsWidget(QWidget):
         self.apply_header_label_styling(self.app_limits_header)
         layout.addWidget(self.app_limits_header)
         
-        # Store toggle state but don't show it (always enabled)
-        self.goals_manager.goals['app_limits_enabled'] = True
-        self.goals_manager.save_goals()
-        
         # Add new limit section
         add_layout = QHBoxLayout()
         add_layout.setSpacing(12)
@@ -690,7 +955,18 @@ class GoalsWidget(QWidget):
         self.apply_section_label_styling(limits_label)
         self.limits_label = limits_label  # Store reference
         
-        self.limits_list_widget = QListWidget()
+        self.limits_model = AppLimitsModel(self)
+        self.limits_delegate = AppLimitDelegate(self)
+        self.limits_delegate.set_dark(self._is_dark())
+        # Queued so the model reset runs after the view finishes handling the click
+        self.limits_delegate.remove_requested.connect(self.remove_limit, Qt.ConnectionType.QueuedConnection)
+        
+        self.limits_list_widget = QListView()
+        self.limits_list_widget.setModel(self.limits_model)
+        self.limits_list_widget.setItemDelegate(self.limits_delegate)
+        self.limits_list_widget.setUniformItemSizes(True)
+        self.limits_list_widget.setMouseTracking(True)  # Hover highlight
+        self.limits_list_widget.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         self.limits_list_widget.setMinimumHeight(0)
         self.limits_list_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
         self.apply_list_styling(self.limits_list_widget)
@@ -708,7 +984,7 @@ class GoalsWidget(QWidget):
     def create_progress_card(self):
         """Create progress overview card"""
         card = QFrame()
-        self.apply_card_styling(card)
+        self.apply_progress_card_styling(card)
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(30, 24, 30, 24)
@@ -736,14 +1012,12 @@ class GoalsWidget(QWidget):
         header_layout.addWidget(refresh_btn)
         layout.addLayout(header_layout)
         
-        # Progress containers
-        self.daily_progress_layout = QVBoxLayout()
-        self.daily_progress_layout.setSpacing(12)
-        layout.addLayout(self.daily_progress_layout)
-        
-        self.app_progress_layout = QVBoxLayout()
-        self.app_progress_layout.setSpacing(12)
-        layout.addLayout(self.app_progress_layout)
+        # Progress rows: name and time on one grid row, the bar spanning the next
+        self.progress_grid = QGridLayout()
+        self.progress_grid.setHorizontalSpacing(12)
+        self.progress_grid.setVerticalSpacing(8)
+        self.progress_grid.setColumnStretch(0, 1)
+        layout.addLayout(self.progress_grid)
         
         self.update_progress()
         
@@ -752,19 +1026,39 @@ class GoalsWidget(QWidget):
     
     def populate_app_combo(self):
         """Populate app dropdown with tracked apps"""
-        apps = self.db_manager.get_all_apps()
-        self.app_combo.clear()
-        self.app_combo.addItems(apps)
+        now = time.monotonic()
+        if self._apps_cache is None or now - self._apps_cache_ts > self.APPS_CACHE_TTL:
+            self._apps_cache = self.db_manager.get_all_apps()
+            self._apps_cache_ts = now
+        apps = self._apps_cache
+        
+        current = [self.app_combo.itemText(i) for i in range(self.app_combo.count())]
+        if current == apps:
+            return
+        known = set(current)
+        if not known.issubset(apps):
+            # Apps disappeared (data was cleared), so rebuild the list
+            self.app_combo.clear()
+            self.app_combo.addItems(apps)
+            return
+        # Both lists are sorted, so inserting in order keeps existing rows in place
+        for index, app in enumerate(apps):
+            if app not in known:
+                self.app_combo.insertItem(index, app)
+    
+    def invalidate_apps_cache(self):
+        """Force the next populate_app_combo to re-read tracked apps"""
+        self._apps_cache = None
     
     def toggle_daily_goal(self, state):
         """Toggle daily goal on/off"""
         self.goals_manager.goals['daily_screen_time_enabled'] = (state == Qt.CheckState.Checked.value)
-        self.goals_manager.save_goals()
+        self.goals_manager.mark_dirty()
     
     def toggle_app_limits(self, state):
         """Toggle app limits on/off"""
         self.goals_manager.goals['app_limits_enabled'] = (state == Qt.CheckState.Checked.value)
-        self.goals_manager.save_goals()
+        self.goals_manager.mark_dirty()
     
     def update_daily_goal(self, value):
         """Update daily goal value"""
@@ -787,7 +1081,7 @@ class GoalsWidget(QWidget):
             # Fallback to QMessageBox
             QMessageBox.information(self, "Success", f"Daily goal set to {hours} hours!")
         
-        self.update_progress()
+        self._schedule_update('progress')
     
     def add_app_limit(self):
         """Add app-specific limit"""
@@ -796,8 +1090,8 @@ class GoalsWidget(QWidget):
         
         if app_name:
             self.goals_manager.set_app_limit(app_name, hours)
-            self.update_limits_list()
-            self.update_progress()
+            self._schedule_update('limits')
+            self._schedule_update('progress')
             
             # Use toast notification if available
             if self.notifier:
@@ -813,193 +1107,177 @@ class GoalsWidget(QWidget):
     
     def update_limits_list(self):
         """Update the list of current limits"""
-        self.limits_list_widget.clear()
+        if not self.isVisible():
+            self._pending_updates.add('limits')  # Refreshed from showEvent
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            self._refresh_limits_list()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _refresh_limits_list(self):
+        """Sync the limits model and size the list to its rows"""
+        app_limits = self.goals_manager.goals['app_limits']
+        self.limits_model.set_limits(app_limits)
         
         # Show/hide the list widget and label based on whether there are limits
-        if not self.goals_manager.goals['app_limits']:
+        if not app_limits:
             self.limits_list_widget.hide()
-            if hasattr(self, 'limits_label'):
+            if self.limits_label is not None:
                 self.limits_label.hide()
             return
         else:
             self.limits_list_widget.show()
-            if hasattr(self, 'limits_label'):
+            if self.limits_label is not None:
                 self.limits_label.show()
         
-        for app_name, limit_seconds in self.goals_manager.goals['app_limits'].items():
-            hours = limit_seconds / 3600
-            item = QListWidgetItem(f"{app_name}: {hours:.1f} hours/day")
-            
-            # Add remove button
-            widget = QWidget()
-            widget.setStyleSheet("background-color: transparent;")
-            layout = QHBoxLayout(widget)
-            layout.setContentsMargins(10, 2, 10, 2)  # Reduced vertical padding
-            layout.setSpacing(10)
-            
-            label = QLabel(f"{app_name}: {hours:.1f} hours/day")
-            theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-            is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-            text_color = '#FFFFFF' if is_dark else '#1C1C1E'
-            label.setStyleSheet(f"background-color: transparent; color: {text_color}; font-size: 14px; font-weight: 500;")
-            
-            remove_btn = QPushButton("Remove")
-            remove_btn.setFixedWidth(85)
-            remove_btn.setFixedHeight(36)
-            remove_btn.clicked.connect(lambda checked, app=app_name: self.remove_limit(app))
-            remove_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            remove_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF3B30;
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 14px;
-                    font-size: 13px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: #CC2E24;
-                }
-                QPushButton:pressed {
-                    background-color: #A01E17;
-                }
-            """)
-            
-            layout.addWidget(label)
-            layout.addStretch()
-            layout.addWidget(remove_btn)
-            
-            # Set proper item height - increased by 15px
-            item.setSizeHint(QSize(widget.sizeHint().width(), 57))
-            self.limits_list_widget.addItem(item)
-            self.limits_list_widget.setItemWidget(item, widget)
-        
         # Adjust list height based on content
-        item_count = self.limits_list_widget.count()
-        if item_count > 0:
-            item_height = self.limits_list_widget.sizeHintForRow(0)
-            total_height = min(item_height * item_count + 20, 250)  # Max 250px
-            self.limits_list_widget.setMinimumHeight(total_height)
-            self.limits_list_widget.setMaximumHeight(total_height)
+        total_height = min(AppLimitDelegate.ROW_HEIGHT * len(app_limits) + 20, 250)  # Max 250px
+        self.limits_list_widget.setMinimumHeight(total_height)
+        self.limits_list_widget.setMaximumHeight(total_height)
         
         # Force card to resize only if it exists
-        if hasattr(self, 'app_limits_card'):
+        if self.app_limits_card is not None:
             self.app_limits_card.adjustSize()
             self.app_limits_card.updateGeometry()
     
     def remove_limit(self, app_name):
         """Remove app limit"""
         self.goals_manager.remove_app_limit(app_name)
-        self.update_limits_list()
-        self.update_progress()
+        self._schedule_update('limits')
+        self._schedule_update('progress')
+    
+    def _schedule_update(self, kind):
+        """Queue a 'limits' or 'progress' refresh for the next event-loop pass"""
+        self._pending_updates.add(kind)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    def _run_pending_updates(self):
+        """Run each queued refresh once, however many times it was requested"""
+        pending = self._pending_updates
+        self._pending_updates = set()
+        if 'limits' in pending:
+            self.update_limits_list()
+        if 'progress' in pending:
+            self.update_progress()
     
     def update_progress(self):
         """Update progress bars"""
-        # Clear existing progress bars
-        for i in reversed(range(self.daily_progress_layout.count())): 
-            self.daily_progress_layout.itemAt(i).widget().setParent(None)
-        
-        for i in reversed(range(self.app_progress_layout.count())): 
-            self.app_progress_layout.itemAt(i).widget().setParent(None)
-        
+        if not self._built:
+            return  # Nothing to refresh until the tab has been shown
+        if not self.isVisible():
+            self._pending_updates.add('progress')  # Refreshed from showEvent
+            return
+        # Rebuild with painting off so the rows lay out and repaint once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            self._rebuild_progress()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _rebuild_progress(self):
+        """Diff the daily and per-app progress rows against today's usage"""
         date = datetime.now().strftime('%Y-%m-%d')
-        app_data = self.db_manager.get_app_usage_by_date(date)
+        goals = self.goals_manager.goals
+        
+        # Desired rows in display order: key -> (label, current, limit, percentage)
+        wanted = {}
         
         # Daily progress
-        if self.goals_manager.goals['daily_screen_time_enabled']:
-            total_time = sum(duration for _, duration in app_data)
-            limit = self.goals_manager.goals['daily_screen_time_goal']
+        if goals['daily_screen_time_enabled']:
+            total_time = self.db_manager.get_total_usage_by_date(date)
+            limit = goals['daily_screen_time_goal']
             progress = (total_time / limit * 100) if limit > 0 else 0
-            
-            progress_bar = self.create_progress_bar(
-                "Daily Screen Time",
-                total_time,
-                limit,
-                min(progress, 100)
-            )
-            self.daily_progress_layout.addWidget(progress_bar)
+            wanted['__daily__'] = ("Daily Screen Time", total_time, limit, min(progress, 100))
         
         # App-specific progress
-        if self.goals_manager.goals['app_limits_enabled']:
-            for app_name, duration in app_data:
-                if app_name in self.goals_manager.goals['app_limits']:
-                    limit = self.goals_manager.goals['app_limits'][app_name]
-                    progress = (duration / limit * 100) if limit > 0 else 0
-                    
-                    progress_bar = self.create_progress_bar(
-                        app_name,
-                        duration,
-                        limit,
-                        min(progress, 100)
-                    )
-                    self.app_progress_layout.addWidget(progress_bar)
-    
-    def create_progress_bar(self, label, current, limit, percentage):
-        """Create a progress bar widget"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(0, 5, 0, 5)
-        
-        # Get theme colors
-        theme = self.theme_manager.get_current_theme() if self.theme_manager else {}
-        is_dark = self.theme_manager.dark_mode if self.theme_manager else False
-        text_color = '#FFFFFF' if is_dark else '#1C1C1E'
-        muted_color = '#98989D' if is_dark else '#8E8E93'
-        
-        # Label
-        info_layout = QHBoxLayout()
-        name_label = QLabel(label)
-        name_label.setStyleSheet(f"font-weight: 600; color: {text_color}; background-color: transparent;")
-        
-        current_hours = current / 3600
-        limit_hours = limit / 3600
-        time_label = QLabel(f"{current_hours:.1f}h / {limit_hours:.1f}h")
-        time_label.setStyleSheet(f"color: {muted_color}; background-color: transparent;")
-        
-        info_layout.addWidget(name_label)
-        info_layout.addStretch()
-        info_layout.addWidget(time_label)
-        
-        layout.addLayout(info_layout)
+        if goals['app_limits_enabled']:
+            app_limits = goals['app_limits']
+            # Only the limited apps are read back, already ordered by usage
+            for app_name, duration in self.db_manager.get_app_usage_for_apps(date, app_limits):
+                limit = app_limits[app_name]
+                progress = (duration / limit * 100) if limit > 0 else 0
+                wanted[app_name] = (app_name, duration, limit, min(progress, 100))
+        
+        grid = self.progress_grid
+        positions = {key: index for index, key in enumerate(wanted)}
+        
+        # Take out rows that moved or are no longer needed; dropped rows go back to the pool
+        moved = {}
+        for key in [key for key, (index, _) in self._progress_rows.items() if positions.get(key) != index]:
+            row = self._progress_rows.pop(key)[1]
+            for widget in row:
+                grid.removeWidget(widget)
+            if key in positions:
+                moved[key] = row
+            elif len(self._progress_pool) < self.PROGRESS_POOL_MAX:
+                for widget in row:
+                    widget.hide()
+                self._progress_pool.append(row)
+            else:
+                for widget in row:
+                    widget.deleteLater()
+        
+        # Update rows in place and put new or moved rows at their grid position
+        for key, (label, current, limit, percentage) in wanted.items():
+            entry = self._progress_rows.get(key)
+            if entry is None:
+                row = moved.pop(key, None)
+                if row is None:
+                    row = self._progress_pool.pop() if self._progress_pool else self.create_progress_bar()
+                index = positions[key]
+                grid.addWidget(row.name_label, 2 * index, 0)
+                grid.addWidget(row.time_label, 2 * index, 1, Qt.AlignmentFlag.AlignRight)
+                grid.addWidget(row.bar, 2 * index + 1, 0, 1, 2)
+                for widget in row:
+                    widget.show()
+                self._progress_rows[key] = (index, row)
+            else:
+                row = entry[1]
+            self.fill_progress_bar(row, label, current, limit, percentage)
+    
+    def create_progress_bar(self):
+        """Create an empty progress row; fill_progress_bar sets its content"""
+        # Styled by the progress card's stylesheet through these object names
+        name_label = QLabel()
+        name_label.setObjectName("progressName")
+        time_label = QLabel()
+        time_label.setObjectName("progressTime")
         
         # Progress bar
         progress = QProgressBar()
-        progress.setValue(int(percentage))
         progress.setTextVisible(True)
-        progress.setFormat(f"{int(percentage)}%")
         progress.setFixedHeight(25)
         
+        return ProgressRow(name_label, time_label, progress)
+    
+    def fill_progress_bar(self, row, label, current, limit, percentage):
+        """Set a progress row's text, value and severity"""
         # Color based on progress
         if percentage >= 100:
-            color = "#FF3B30"  # Red - exceeded
+            severity = 'red'  # Exceeded
         elif percentage >= 80:
-            color = "#FF9500"  # Orange - warning
+            severity = 'orange'  # Warning
         else:
-            color = "#34C759"  # Green - good
-        
-        # Background color for progress bar
-        bar_bg = "#2C2C2E" if is_dark else "#F2F2F7"
-        bar_border = "#48484A" if is_dark else "#E5E5EA"
-        
-        progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 2px solid {bar_border};
-                border-radius: 8px;
-                text-align: center;
-                font-weight: 600;
-                background-color: {bar_bg};
-                color: {text_color};
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 6px;
-            }}
-        """)
-        
-        layout.addWidget(progress)
-        
-        return widget
+            severity = 'green'  # Good
+        
+        row.name_label.setText(label)
+        
+        current_hours = current / 3600
+        limit_hours = limit / 3600
+        row.time_label.setText(f"{current_hours:.1f}h / {limit_hours:.1f}h")
+        
+        progress = row.bar
+        progress.setValue(int(percentage))
+        progress.setFormat(f"{int(percentage)}%")
+        
+        # The chunk color follows the severity property; repolish instead of a new sheet
+        if progress.property('severity') != severity:
+            progress.setProperty('severity', severity)
+            progress.style().unpolish(progress)
+            progress.style().polish(progress)
     
     def update_theme(self):
         """Update theme for all widgets"""
@@ -1007,44 +1285,42 @@ class GoalsWidget(QWidget):
         self.apply_title_styling()
         
         # Update all header labels
-        if hasattr(self, 'daily_goal_header'):
+        if self.daily_goal_header is not None:
             self.apply_header_label_styling(self.daily_goal_header)
-        if hasattr(self, 'app_limits_header'):
+        if self.app_limits_header is not None:
             self.apply_header_label_styling(self.app_limits_header)
-        if hasattr(self, 'progress_header'):
+        if self.progress_header is not None:
             self.apply_header_label_styling(self.progress_header)
-        if hasattr(self, 'limits_label'):
+        if self.limits_label is not None:
             self.apply_section_label_styling(self.limits_label)
         
         # Re-apply all card styling
-        if hasattr(self, 'daily_goal_card'):
+        if self.daily_goal_card is not None:
             self.apply_card_styling(self.daily_goal_card)
-        if hasattr(self, 'app_limits_card'):
+        if self.app_limits_card is not None:
             self.apply_card_styling(self.app_limits_card)
-        if hasattr(self, 'progress_card'):
-            self.apply_card_styling(self.progress_card)
+        if self.progress_card is not None:
+            self.apply_progress_card_styling(self.progress_card)
         
         # Re-apply all other styling
-        if hasattr(self, 'daily_goal_spinbox'):
+        if self.daily_goal_spinbox is not None:
             self.apply_spinbox_styling(self.daily_goal_spinbox)
-        if hasattr(self, 'app_combo'):
+        if self.app_combo is not None:
             self.apply_combobox_styling(self.app_combo)
-        if hasattr(self, 'app_limit_spinbox'):
+        if self.app_limit_spinbox is not None:
             self.apply_spinbox_styling(self.app_limit_spinbox)
-        if hasattr(self, 'limits_list_widget'):
+        if self.limits_list_widget is not None:
             self.apply_list_styling(self.limits_list_widget)
-            self.update_limits_list()  # Re-render list items with new theme
+            # Rows are painted by the delegate, so a color swap plus repaint is enough
+            self.limits_delegate.set_dark(self._is_dark())
+            self.limits_list_widget.viewport().update()
         
         # Re-apply scroll area styling
-        scroll_area = self.findChild(QScrollArea)
-        if scroll_area:
-            self.apply_scroll_styling(scroll_area)
-        
-        # Update progress with new colors
-        self.update_progress()
+        self.apply_scroll_styling(self.scroll_area)
         
-        # Force update
+        # Progress rows take their colors from the card sheet applied above,
+        # so they need only a repaint, not a refresh
         self.update()
 
 # Export
-__all__ = ['GoalsManager', 'GoalsWidget']
+__all__ = ['GoalsManager', 'GoalsWidget', 'LimitWarning']
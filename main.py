@@ -9,11 +9,16 @@ Features:
 - Clean Apple-inspired UI
 """
 
+import os
 import sys
+import atexit
 import json
+import ctypes
+from ctypes import wintypes
 import sqlite3
 import threading
 import time
+import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 import psutil
@@ -31,6 +36,45 @@ from category_manager import CategoryManager
 # Set matplotlib style for clean appearance
 mplstyle.use('seaborn-v0_8-whitegrid')
 
+# Idle detection WinAPI, resolved once for the once-per-second idle check
+class LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [('cbSize', ctypes.c_uint), ('dwTime', ctypes.c_uint)]
+
+_GetLastInputInfo = ctypes.windll.user32.GetLastInputInfo
+_GetLastInputInfo.argtypes = [ctypes.POINTER(LASTINPUTINFO)]
+_GetLastInputInfo.restype = ctypes.c_bool
+_GetTickCount = ctypes.windll.kernel32.GetTickCount
+_GetTickCount.argtypes = []
+_GetTickCount.restype = ctypes.c_uint
+_last_input_info = LASTINPUTINFO()
+_last_input_info.cbSize = ctypes.sizeof(LASTINPUTINFO)
+
+# Process image name lookup, much lighter than building a psutil.Process per tick
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_OpenProcess = ctypes.windll.kernel32.OpenProcess
+_OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_OpenProcess.restype = wintypes.HANDLE
+_QueryFullProcessImageNameW = ctypes.windll.kernel32.QueryFullProcessImageNameW
+_QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)]
+_QueryFullProcessImageNameW.restype = wintypes.BOOL
+_CloseHandle = ctypes.windll.kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+
+def process_name(pid):
+    """Executable file name of a process, or None if it can't be queried"""
+    handle = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        buf = ctypes.create_unicode_buffer(32768)
+        size = wintypes.DWORD(len(buf))
+        if not _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            return None
+        return os.path.basename(buf.value)
+    finally:
+        _CloseHandle(handle)
+
 class ThemeManager:
     def __init__(self):
         self.dark_mode = False
@@ -147,14 +191,73 @@ except ImportError as e:
     NotificationManager = None
 
 class DatabaseManager:
+    # Columns of get_usage_range_np: one row per (date, app) with summed seconds
+    USAGE_DTYPE = [('date', 'datetime64[D]'), ('app', 'O'), ('dur', 'i8')]
+    
     def __init__(self, db_path="tracking_data.db"):
         self.db_path = Path(__file__).parent / db_path
+        self.usage_version = 0  # Bumped on every app_usage write so readers can cache
+        self._local = threading.local()  # One reused connection per thread
+        self._conns = []  # Every open per-thread connection, so close_all can reach them
+        self._conns_lock = threading.Lock()
+        self._generation = 0  # Bumped by close_all; older thread connections are reopened
+        self._today_str = None
+        self._today_until = 0.0  # Epoch seconds of the next local midnight
         self.init_database()
     
+    def today(self):
+        """Today's date as YYYY-MM-DD, reformatted only once the day rolls over"""
+        if time.time() >= self._today_until:
+            now = datetime.now()
+            self._today_str = now.strftime('%Y-%m-%d')
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            self._today_until = midnight.timestamp()
+        return self._today_str
+    
+    def _conn(self):
+        """This thread's connection, opened on first use and reused until close_all"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            # check_same_thread=False lets close_all close it from another thread
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # Per-connection settings, so they are applied once here rather than per call
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            with self._conns_lock:
+                self._conns.append(conn)
+                self._local.generation = self._generation
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            with self._conns_lock:
+                if conn in self._conns:
+                    self._conns.remove(conn)
+            conn.close()
+            self._local.conn = None
+    
+    def close_all(self):
+        """Close every thread's connection, e.g. before the database file is replaced"""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+            self._generation += 1
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"Error closing database connection: {e}")
+        # Whatever readers cached no longer matches the file they will reopen
+        self.usage_version += 1
+    
     def init_database(self):
         """Initialize SQLite database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
+            # WAL lets batched writes commit without blocking readers (persists in the file)
+            cursor.execute("PRAGMA journal_mode=WAL")
             
             # Application tracking table
             cursor.execute("""
@@ -179,10 +282,27 @@ class DatabaseManager:
                     start_time TIMESTAMP,
                     end_time TIMESTAMP,
                     duration INTEGER,
-                    date TEXT
+                    date TEXT,
+                    domain TEXT
                 )
             """)
             
+            # Older databases predate the domain column; NULL there means "not extracted yet"
+            browser_columns = {row[1] for row in cursor.execute("PRAGMA table_info(browser_usage)")}
+            if 'domain' not in browser_columns:
+                cursor.execute("ALTER TABLE browser_usage ADD COLUMN domain TEXT")
+            
+            indexes = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+            new_indexes = not {'idx_app_usage_date_start', 'idx_app_usage_date_app',
+                               'idx_browser_usage_date_tab'} <= indexes
+            # (date, start_time) serves both the date-range filter and the export ORDER BY
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_app_usage_date_start ON app_usage(date, start_time)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_browser_usage_date_start ON browser_usage(date, start_time)")
+            # Covering indexes so the per-day GROUP BY totals never touch the table rows
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_app_usage_date_app ON app_usage(date, app_name, duration)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_browser_usage_date_tab ON browser_usage(date, browser_name, tab_title, duration)")
+            cursor.execute("DROP INDEX IF EXISTS idx_browser_date")  # Covered by the composite index
+            
             # Daily summary table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS daily_summary (
@@ -196,12 +316,14 @@ class DatabaseManager:
             """)
             
             conn.commit()
+            if new_indexes:
+                cursor.execute("ANALYZE")  # Let the planner see the new indexes once
     
     def get_all_apps(self):
         """Get list of all tracked apps"""
         apps = set()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT DISTINCT app_name FROM app_usage")
             for row in cursor.fetchall():
@@ -211,34 +333,57 @@ class DatabaseManager:
     
     def save_app_usage(self, app_name, window_title, start_time, end_time, duration):
         """Save application usage data"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = self.today()
             cursor.execute("""
                 INSERT INTO app_usage 
                 (app_name, window_title, start_time, end_time, duration, date)
                 VALUES (?, ?, ?, ?, ?, ?)
             """, (app_name, window_title, start_time, end_time, duration, date))
             conn.commit()
+        self.usage_version += 1
+    
+    def save_app_usage_batch(self, rows):
+        """Save buffered application usage rows in one transaction"""
+        # Rows are (app_name, window_title, start_time, end_time, duration, date)
+        with self._conn() as conn:
+            conn.executemany("""
+                INSERT INTO app_usage 
+                (app_name, window_title, start_time, end_time, duration, date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+        self.usage_version += 1
     
-    def save_browser_usage(self, browser_name, tab_title, url, start_time, end_time, duration):
+    def save_browser_usage(self, browser_name, tab_title, url, start_time, end_time, duration, domain=None):
         """Save browser usage data"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = self.today()
             cursor.execute("""
                 INSERT INTO browser_usage 
-                (browser_name, tab_title, url, start_time, end_time, duration, date)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (browser_name, tab_title, url, start_time, end_time, duration, date))
+                (browser_name, tab_title, url, start_time, end_time, duration, date, domain)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (browser_name, tab_title, url, start_time, end_time, duration, date, domain))
+            conn.commit()
+    
+    def save_browser_usage_batch(self, rows):
+        """Save buffered browser usage rows in one transaction"""
+        # Rows are (browser_name, tab_title, url, start_time, end_time, duration, date, domain)
+        with self._conn() as conn:
+            conn.executemany("""
+                INSERT INTO browser_usage 
+                (browser_name, tab_title, url, start_time, end_time, duration, date, domain)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
             conn.commit()
     
     def get_app_usage_by_date(self, date=None):
         """Get application usage data for a specific date"""
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = self.today()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT app_name, SUM(duration) as total_duration
@@ -248,13 +393,100 @@ class DatabaseManager:
                 ORDER BY total_duration DESC
             """, (date,))
             return cursor.fetchall()
-    
+
+    def get_app_usage_for_apps(self, date, app_names):
+        """Get usage for just the given applications on a specific date"""
+        app_names = list(app_names)
+        if not app_names:
+            return []
+        placeholders = ",".join("?" * len(app_names))
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT app_name, SUM(duration) as total_duration
+                FROM app_usage
+                WHERE date = ? AND app_name IN ({placeholders})
+                GROUP BY app_name
+                ORDER BY total_duration DESC
+            """, [date] + app_names)
+            return cursor.fetchall()
+
+    def get_total_usage_by_date(self, date):
+        """Get total application usage in seconds for a specific date"""
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(SUM(duration), 0) FROM app_usage WHERE date = ?", (date,))
+            return cursor.fetchone()[0]
+
+    def get_app_usage_range(self, start_date, end_date):
+        """Get per-day application usage for an inclusive date range"""
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT date, app_name, SUM(duration) as total_duration
+                FROM app_usage
+                WHERE date BETWEEN ? AND ?
+                GROUP BY date, app_name
+            """, (start_date, end_date))
+            return cursor.fetchall()
+
+    def get_usage_range_np(self, start_date, end_date):
+        """Get per-day application usage for an inclusive date range as a columnar NumPy array"""
+        rows = self.get_app_usage_range(start_date, end_date)
+        return np.array(
+            [(date, sys.intern(app_name), duration) for date, app_name, duration in rows],
+            dtype=self.USAGE_DTYPE
+        )
+
+    def get_app_totals_range(self, start_date, end_date, limit=None):
+        """Get total usage per application for an inclusive date range"""
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            # LIMIT -1 means no limit in SQLite
+            cursor.execute("""
+                SELECT app_name, SUM(duration) as total_duration
+                FROM app_usage
+                WHERE date BETWEEN ? AND ?
+                GROUP BY app_name
+                ORDER BY total_duration DESC
+                LIMIT ?
+            """, (start_date, end_date, -1 if limit is None else limit))
+            return cursor.fetchall()
+
+    def get_app_totals_by_period(self, periods):
+        """Get total usage per application for each of several disjoint inclusive date ranges"""
+        cases = " ".join(f"WHEN date BETWEEN ? AND ? THEN {i}" for i in range(len(periods)))
+        params = [day for period in periods for day in period]
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT CASE {cases} END as period, app_name, SUM(duration) as total_duration
+                FROM app_usage
+                WHERE date BETWEEN ? AND ? AND period IS NOT NULL
+                GROUP BY period, app_name
+                ORDER BY period, total_duration DESC
+            """, params + [min(p[0] for p in periods), max(p[1] for p in periods)])
+            return cursor.fetchall()
+
+    def get_daily_totals_range(self, start_date, end_date):
+        """Get total usage per day for an inclusive date range"""
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT date, SUM(duration) as total_duration
+                FROM app_usage
+                WHERE date BETWEEN ? AND ?
+                GROUP BY date
+                ORDER BY date
+            """, (start_date, end_date))
+            return cursor.fetchall()
+
     def get_browser_usage_by_date(self, date=None):
         """Get browser usage data for a specific date"""
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = self.today()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT browser_name, tab_title, SUM(duration) as total_duration
@@ -265,51 +497,60 @@ class DatabaseManager:
             """, (date,))
             return cursor.fetchall()
     
+    def get_browser_totals_by_date(self, date):
+        """Get total usage per browser for a specific date"""
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT browser_name, SUM(duration) as total_duration
+                FROM browser_usage
+                WHERE date = ?
+                GROUP BY browser_name
+            """, (date,))
+            return cursor.fetchall()
+    
+    def get_domain_totals_by_date(self, date):
+        """Get total usage per stored domain for a specific date"""
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            # Rows saved before domains were stored come back per tab title with a NULL domain
+            cursor.execute("""
+                SELECT domain, CASE WHEN domain IS NULL THEN tab_title END as title,
+                       SUM(duration) as total_duration
+                FROM browser_usage
+                WHERE date = ?
+                GROUP BY domain, title
+            """, (date,))
+            return cursor.fetchall()
+    
     def get_weekly_usage(self):
         """Get usage data for the past 7 days"""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
-        
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT date, SUM(duration) as total_duration
-                FROM app_usage 
-                WHERE date BETWEEN ? AND ?
-                GROUP BY date
-                ORDER BY date
-            """, (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
-            return cursor.fetchall()
+        return self.get_daily_totals_range(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
     
     def get_monthly_usage(self):
         """Get usage data for the past 30 days"""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
-        
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT date, SUM(duration) as total_duration
-                FROM app_usage 
-                WHERE date BETWEEN ? AND ?
-                GROUP BY date
-                ORDER BY date
-            """, (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
-            return cursor.fetchall()
+        return self.get_daily_totals_range(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
     
     def clear_all_data(self):
         """Clear all tracking data"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM app_usage")
             cursor.execute("DELETE FROM browser_usage")
             cursor.execute("DELETE FROM daily_summary")
             conn.commit()
+        self.usage_version += 1
     
     def generate_fake_data(self):
         """Generate fake test data for demonstration purposes"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
+            # One write transaction covers the clear and every insert
+            cursor.execute("BEGIN IMMEDIATE")
             
             # Clear existing data first
             cursor.execute("DELETE FROM app_usage")
@@ -334,6 +575,7 @@ class DatabaseManager:
             from datetime import datetime, timedelta
             import random
             
+            rows = []
             for day_offset in range(30):
                 current_date = datetime.now() - timedelta(days=day_offset)
                 date_str = current_date.strftime('%Y-%m-%d')
@@ -353,17 +595,22 @@ class DatabaseManager:
                     start_time = current_date.replace(hour=start_hour, minute=start_minute, second=0)
                     end_time = start_time + timedelta(seconds=duration)
                     
-                    cursor.execute("""
-                        INSERT INTO app_usage 
-                        (app_name, window_title, start_time, end_time, duration, date)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (app_name, window_title, start_time.isoformat(), end_time.isoformat(), duration, date_str))
+                    rows.append((app_name, window_title, start_time.isoformat(), end_time.isoformat(), duration, date_str))
+            
+            cursor.executemany("""
+                INSERT INTO app_usage 
+                (app_name, window_title, start_time, end_time, duration, date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
             
             conn.commit()
+        self.usage_version += 1
 
 class ActivityTracker(QObject):
     data_updated = pyqtSignal()
     idle_status_changed = pyqtSignal(bool)  # Signal for idle status changes
+    FLUSH_INTERVAL = 5.0  # Seconds between batched app usage writes
+    FLUSH_ROWS = 100  # Buffered sessions that force an early write
     
     def __init__(self, db_manager):
         super().__init__()
@@ -372,6 +619,11 @@ class ActivityTracker(QObject):
         self.current_window = None
         self.start_time = None
         self.tracking = False
+        self._pending = []  # App sessions waiting to be written
+        self._process_names = {}  # (hwnd, pid) -> process name
+        self._last_flush = time.monotonic()
+        # Any shutdown path writes what is still buffered; the UI may be gone by then
+        atexit.register(self.flush, False)
         self.timer = QTimer()
         self.timer.timeout.connect(self.track_activity)
         
@@ -401,21 +653,18 @@ class ActivityTracker(QObject):
         self.tracking = False
         self.timer.stop()
         self.save_current_session()
+        self.flush()
+        if self.browser_tracker:
+            self.browser_tracker.flush()
     
     def check_idle_status(self):
         """Check if the system is idle based on last input time"""
         try:
             # Get last input info for Windows
-            import ctypes
-            class LASTINPUTINFO(ctypes.Structure):
-                _fields_ = [('cbSize', ctypes.c_uint), ('dwTime', ctypes.c_uint)]
-            
-            lii = LASTINPUTINFO()
-            lii.cbSize = ctypes.sizeof(LASTINPUTINFO)
-            ctypes.windll.user32.GetLastInputInfo(ctypes.byref(lii))
+            _GetLastInputInfo(_last_input_info)
             
-            # Calculate idle time in seconds
-            millis = ctypes.windll.kernel32.GetTickCount() - lii.dwTime
+            # Calculate idle time in seconds (masked so a tick count wrap stays positive)
+            millis = (_GetTickCount() - _last_input_info.dwTime) & 0xFFFFFFFF
             idle_seconds = millis / 1000.0
             
             # Check if system became idle (no input for idle_threshold seconds)
@@ -452,6 +701,11 @@ class ActivityTracker(QObject):
     def track_activity(self):
         """Track current active window with idle detection"""
         try:
+            # Write out buffered app and browser sessions every few seconds
+            self.flush_if_due()
+            if self.browser_tracker:
+                self.browser_tracker.flush_if_due()
+            
             # Check if system is idle first (detects inactivity or sleep)
             if self.check_idle_status():
                 # Don't track while idle - this prevents tracking during:
@@ -467,10 +721,15 @@ class ActivityTracker(QObject):
             if not window_title:
                 return
             
-            # Get process info
+            # Get process info; a window keeps its process, so the name is cached per (hwnd, pid)
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            process = psutil.Process(pid)
-            app_name = process.name()
+            key = (hwnd, pid)
+            app_name = self._process_names.get(key)
+            if app_name is None:
+                app_name = process_name(pid) or psutil.Process(pid).name()
+                if len(self._process_names) >= 256:
+                    self._process_names.clear()
+                self._process_names[key] = app_name
             
             # Check if app changed
             if app_name != self.current_app or window_title != self.current_window:
@@ -492,14 +751,15 @@ class ActivityTracker(QObject):
             duration = int((end_time - self.start_time).total_seconds())
             
             if duration > 0:  # Only save if duration > 0
-                # Save app usage
-                self.db_manager.save_app_usage(
+                # Buffer app usage; flush() writes the batch in one transaction
+                self._pending.append((
                     self.current_app,
                     self.current_window,
                     self.start_time.isoformat(),
                     end_time.isoformat(),
-                    duration
-                )
+                    duration,
+                    self.db_manager.today()
+                ))
                 
                 # Save browser usage if it's a browser
                 if self.browser_tracking_enabled and self.browser_tracker:
@@ -512,7 +772,30 @@ class ActivityTracker(QObject):
                             duration
                         )
                 
+                if len(self._pending) >= self.FLUSH_ROWS:
+                    self.flush()
+    
+    def flush_if_due(self):
+        """Flush buffered sessions once FLUSH_INTERVAL has passed since the last write"""
+        if self._pending and time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
+    
+    def flush(self, notify=True):
+        """Write all buffered app sessions to the database"""
+        self._last_flush = time.monotonic()
+        if self._pending:
+            rows, self._pending = self._pending, []
+            self.db_manager.save_app_usage_batch(rows)
+            # Listeners re-read the database, so notify once the rows are there
+            if notify:
                 self.data_updated.emit()
+    
+    def discard_pending(self):
+        """Drop buffered app and browser sessions without writing them, e.g. before the data is wiped"""
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+        if self.browser_tracker:
+            self.browser_tracker.discard_pending()
 
 class ModernButton(QPushButton):
     def __init__(self, text, primary=False, theme_manager=None):
@@ -954,7 +1237,8 @@ class AnalyticsWidget(QWidget):
         
         if data:
             dates = [data_point[0] for data_point in data]
-            times = [data_point[1] / 3600 for data_point in data]  # Convert to hours
+            # SQLite already summed per day; convert to hours in one vectorized step
+            times = np.fromiter((data_point[1] for data_point in data), dtype=np.float64, count=len(data)) / 3600
             
             # IMPROVED: Create smoother line with enhanced styling
             self.ax.plot(dates, times, marker='o', linewidth=3.5, markersize=10, 
@@ -979,14 +1263,8 @@ class AnalyticsWidget(QWidget):
                 tick_positions = range(0, len(dates), step)
                 tick_labels = [dates[i] for i in tick_positions]
                 
-                # Convert dates to datetime for better formatting
-                formatted_labels = []
-                for date_str in tick_labels:
-                    try:
-                        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                        formatted_labels.append(date_obj.strftime('%m/%d'))
-                    except:
-                        formatted_labels.append(date_str[-5:])  # Last 5 chars (MM-DD)
+                # Dates are stored as YYYY-MM-DD, so MM/DD is a slice away
+                formatted_labels = [date_str[5:].replace('-', '/') for date_str in tick_labels]
                 
                 self.ax.set_xticks([i for i in tick_positions])
                 self.ax.set_xticklabels(formatted_labels, rotation=0, ha='center', fontsize=11)
@@ -1590,7 +1868,10 @@ class HistoryWidget(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # 1. Clear database
+                # 1. Clear database, dropping buffered sessions first so they aren't written back
+                main_window = self.window()
+                if hasattr(main_window, 'tracker'):
+                    main_window.tracker.discard_pending()
                 self.db_manager.clear_all_data()
                 
                 # 2. Reset all settings files
@@ -1627,11 +1908,13 @@ class HistoryWidget(QWidget):
                 
                 # Update advanced analytics (Insights tab)
                 if hasattr(main_window, 'advanced_analytics_widget'):
+                    main_window.advanced_analytics_widget.analytics.invalidate()
                     # Force complete refresh by reinitializing the UI
                     main_window.advanced_analytics_widget.init_ui()
                 
                 # Reset goals
                 if hasattr(main_window, 'goals_widget'):
+                    main_window.goals_widget.invalidate_apps_cache()
                     main_window.goals_widget.update_progress()
                 
                 # Show success notification
@@ -1808,6 +2091,8 @@ class MainWindow(QMainWindow):
         if EXPORT_BACKUP_FEATURE and ExportBackupWidget:
             try:
                 self.export_backup_widget = ExportBackupWidget(self.db_manager, theme_manager=self.theme_manager)
+                self.export_backup_widget.about_to_restore.connect(self.tracker.discard_pending)
+                self.export_backup_widget.backup_restored.connect(self.on_backup_restored)
                 self.tabs.addTab(self.export_backup_widget, "📤 Export && Backup")
             except Exception as e:
                 print(f"Error loading Export & Backup widget: {e}")
@@ -2149,6 +2434,10 @@ class MainWindow(QMainWindow):
     
     def on_data_updated(self):
         """Handle data updates"""
+        # Today's cached insights are stale once a new session is saved
+        if hasattr(self, 'advanced_analytics_widget'):
+            self.advanced_analytics_widget.analytics.invalidate(self.db_manager.today())
+        
         self.analytics_widget.update_analytics()
         self.history_widget.update_history()
         
@@ -2165,6 +2454,14 @@ class MainWindow(QMainWindow):
             except:
                 pass
     
+    def on_backup_restored(self):
+        """Drop caches built from the replaced database and refresh every view"""
+        if hasattr(self, 'advanced_analytics_widget'):
+            self.advanced_analytics_widget.analytics.invalidate()
+        if hasattr(self, 'goals_widget'):
+            self.goals_widget.invalidate_apps_cache()
+        self.on_data_updated()
+    
     def on_idle_status_changed(self, is_idle):
         """Handle idle status changes and update UI"""
         if is_idle:
@@ -2240,29 +2537,30 @@ class MainWindow(QMainWindow):
             print("Goals check skipped: manager not available or notifications disabled")
             return
         
-        warnings = self.goals_manager.check_limits(self.db_manager)
+        now = datetime.now()  # One clock read serves the whole check
+        warnings = self.goals_manager.check_limits(self.db_manager, now=now)
         print(f"Goals check completed - found {len(warnings)} warnings")
         
         for warning in warnings:
             # Only show each warning once per hour
-            warning_id = f"{warning['type']}_{warning.get('app', 'daily')}"
+            warning_id = f"{warning.type}_{warning.app or 'daily'}"
             
-            if self.goals_manager.should_notify(warning_id):
-                print(f"Showing notification: {warning['type']} - {warning['message']}")
+            if self.goals_manager.should_notify(warning_id, now=now):
+                print(f"Showing notification: {warning.type} - {warning.message}")
                 # Use toast notifications if available
                 if self.notifier:
-                    if warning['severity'] == 'critical':
+                    if warning.severity == 'critical':
                         self.notifier.error(
                             "Limit Exceeded! ⚠️",
-                            warning['message'],
+                            warning.message,
                             duration=7000,
                             action_text="View Goals",
                             action_callback=lambda: self.tabs.setCurrentWidget(self.goals_widget) if hasattr(self, 'goals_widget') else None
                         )
-                    elif warning['severity'] == 'warning':
+                    elif warning.severity == 'warning':
                         self.notifier.warning(
                             "Approaching Limit",
-                            warning['message'],
+                            warning.message,
                             duration=6000,
                             action_text="View Stats",
                             action_callback=lambda: self.tabs.setCurrentWidget(self.analytics_widget)
@@ -2270,17 +2568,17 @@ class MainWindow(QMainWindow):
                     else:
                         self.notifier.info(
                             "Usage Update",
-                            warning['message'],
+                            warning.message,
                             duration=5000
                         )
                     print("Toast notification sent!")
                 else:
                     print("No notifier available - using fallback")
                     # Fallback to old system
-                    if warning['severity'] == 'critical':
-                        QMessageBox.warning(self, "Limit Exceeded", warning['message'])
-                    elif warning['severity'] == 'warning':
-                        self.statusBar().showMessage(warning['message'], 10000)
+                    if warning.severity == 'critical':
+                        QMessageBox.warning(self, "Limit Exceeded", warning.message)
+                    elif warning.severity == 'warning':
+                        self.statusBar().showMessage(warning.message, 10000)
             else:
                 print(f"Notification already sent for: {warning_id}")
     
@@ -2398,6 +2696,17 @@ class MainWindow(QMainWindow):
         if self.tracker.tracking:
             self.tracker.stop_tracking()
         
+        # Write any goal edits still waiting on the debounce timer
+        if self.goals_manager:
+            self.goals_manager.flush()
+        
+        # Release the export tab's database connection
+        if hasattr(self, 'export_backup_widget'):
+            self.export_backup_widget.exporter.close()
+        
+        # Close the main thread's database connection
+        self.db_manager.close()
+        
         # Hide tray icon
         self.tray_icon.hide()
         